@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Static texts of the game (story, dialogues, menus and system messages), in one place for every language.
+
+Texts may contain rich markup and emoji shortcodes. They are parsed once, when
+a text is first used, and the same :class:`rich.text.Text` is handed out later,
+so displaying it skips parsing::
+
+    console.print(catalog.text('menu.goodbye'))
+
+Texts with placeholders are templates, they are returned as they are by indexing::
+
+    Message(catalog['world.go.arrived'], location)
+    catalog['world.characters.many'].format(count=3)
+
+``{}`` placeholders are filled with entities by :class:`FTE.results.Message`,
+named placeholders with :meth:`str.format`.
+"""
+from functools import lru_cache
+
+from rich.markup import render
+from rich.text import Text
+
+from FTE.settings import LANGUAGE
+
+
+DEFAULT_LANGUAGE: str = 'en'  # Used for texts missing in other languages
+TEXTS: dict[str, dict[str, str]] = dict(
+    en={
+        # Main menu
+        'menu.title': 'Main menu',
+        'menu.start': '1. Let\'s fix them!',
+        'menu.later': '2. Maybe later...',
+        'menu.choice': 'Your choice? ',
+        'menu.goodbye': ':wave: Goodbye!',
+        # Server
+        'server.full': 'All seats on the ship are taken, try again later.',
+        # World
+        'world.help': 'Help',
+        'world.first.welcome': 'This is your first interaction with the World.',
+        'world.first.assistant': 'Would you like to enable assitant?',
+        'world.first.yes_or_no': '"yes" or "no"? ',
+        'world.first.declined': 'OK! I won\'t ask you again. Have fun!',
+        'world.first.about': '[bold]Fix The Engines[/bold] is text-based, paragraph game.'
+                             ' There is no mouse control, you operate only with commands.',
+        'world.first.help': 'You can show them by typing "help" during interaction with the World.',
+        'world.first.commands': 'All commands are single words. For example "help" or "go" insted of "go to".',
+        'world.first.fun': 'Have fun! :smile:',
+        'world.enters': 'Walks in.',
+        'world.leaves': 'Walks out.',
+        'world.did_you_mean': 'Did you mean {choices}?',
+        'world.or': ' or ',
+        'world.characters.none': 'There are no characters in this location.',
+        'world.characters.one': 'There is 1 character in this location: ',
+        'world.characters.many': 'There are {count} characters in this location: ',
+        'world.locations.none': 'There are no other locations you can go to.',
+        'world.locations.one': 'There is 1 other location you can go to: ',
+        'world.locations.many': 'There are {count} other locations you can go to: ',
+        'world.exit': 'Goodbye!',
+        'world.talk.nobody': 'You speak to everyone, but no one hears you.',
+        'world.talk.unknown': 'You don\'t know this character.',
+        'world.talk.absent': 'This chracter is not here.',
+        'world.talk.unwilling': '{} does not want to talk with you.',
+        'world.go.nowhere': 'After running in circle for a while you find it worthless.',
+        'world.go.unknown': 'You don\'t know this location.',
+        'world.go.here': 'You\'re currently here.',
+        'world.go.unreachable': 'There is no way to {} from here.',
+        'world.go.through': 'You go through ',
+        'world.go.arrived': 'You\'re now in {}.',
+        'world.info.unknown_location': 'You don\'t know anything about this location.',
+        'world.info.standing': '{} has {} standing towards you.',
+        'world.info.character': '{}-{}',
+        'world.info.unknown': 'I don\'t know what do you mean.',
+        'world.unknown.hint': 'Psst, you can use `help`.',
+        'world.unknown': 'I\'m not sure what do you mean.',
+        # Help
+        'help.commands': 'Available commands',
+        'help.command': 'Command',
+        'help.description': 'Description',
+        'help.usage': 'Usage',
+        'help.arguments': 'Arguments description',
+        'help.representation': 'Representation',
+        'help.required': 'Required argument.',
+        'help.optional': 'Optional argument.',
+        'help.choice': 'Optional argument, but only "a" or "b".',
+        'command.exit': 'Exits the game.',
+        'command.help': 'Shows help. Optionally only "commands" or "arguments".',
+        'command.talk': 'Talk to someone. Pass character name to start conversation with them.'
+                        ' You can talk only to characters in your location.',
+        'command.go': 'Go somewhere. Pass location name to go there.',
+        'command.info': 'Get information about a character or a location.'
+                        ' Do not pass anything to show info about current location.',
+        # Chapter one
+        'one.title': 'Chapter I',
+        'one.year': 'Year:      3015',
+        'one.ship': 'Ship:      Epsilon IV',
+        'one.mission': 'Mission:   Who cares?',
+        'one.ellipsis': '...',
+        'one.wake_up': 'You wake up in your bed, someone is trying to talk to you, but you\'re too sleepy to understand.',
+        'one.recognize': 'You recognize them. I\'s your roommate - {}.',
+        'one.shaking': 'He\'s shaking you and after a while you can finally understand him...',
+        'one.bridge': 'Big fishes spend time here.',
+        'one.capsules': 'You can escape the ship here during an emergency.',
+        'one.engine_deck': 'Here engineers make sure the ship is working properly.',
+        'one.quarters': 'All crewmen spend night and freetime here.',
+        'one.hevy.poke': 'Good to see you.',
+        'one.rex.poke': 'Yes sergant? Oh, wait.',
+        'one.mixiu.poke': 'What the fuck do you want?',
+        'one.tech.poke': 'We should invest in twin ion engines.',
+        'one.hevy.dead': 'Hey! Man! Are you dead already?',
+        'one.hevy.silence': '...',
+        'one.hevy.dead.yes': 'Unfortunately no',
+        'one.hevy.dead.no': 'That\'s great',
+        'one.hevy.wake_up': '{answer}, now wake up and get a move on, of we\'re screwed.',
+        'one.hevy.clothes': 'Throws you your clothes.',
+        'one.hevy.ready': 'Aight, you ready?',
+        'one.hevy.claps': 'Claps to you.',
+        'one.hevy.where': 'We either go to {} or to {}, I don\'t trust our engineers tho.',
+        'one.hevy.hurry': 'There\'s no time, let\'s go!',
+        'one.hevy.capsules': 'This ship sucks either way...',
+        'one.tech.surprised': 'Hey! What are you doing here?',
+        'one.hevy.engine_deck': 'Don\'t worry, we\'re here to help.',
+        'one.more': '...more coming soon!',
+    }
+)
+
+
+@lru_cache(maxsize=1024)
+def parse(markup: str, emoji: bool = True) -> Text:
+    """Parses rich markup and emoji shortcodes, like :meth:`rich.console.Console.print` does with strings.
+
+    Results are cached, so they are shared and must not be modified.
+
+    :param markup: The text.
+    :type markup: :obj:`str`
+    :param emoji: If emoji shortcodes are replaced, e.g. ``:rocket:``.
+    :type emoji: :obj:`bool`
+    :return: Styled text.
+    :rtype: :class:`rich.text.Text`
+    """
+    return render(markup, emoji=emoji)
+
+
+class Catalog:
+    """Static texts of a single language.
+
+    :param language: The language, texts missing in it are taken from :data:`DEFAULT_LANGUAGE`.
+    :type language: :obj:`str`
+    """
+    def __init__(self, language: str = DEFAULT_LANGUAGE) -> None:
+        self.language: str = language
+        self._texts: dict[str, str] = {**TEXTS[DEFAULT_LANGUAGE], **TEXTS.get(language, {})}
+        self._parsed: dict[str, Text] = {}
+
+    def __getitem__(self, key: str) -> str:
+        """Raw text or template, with markup.
+
+        :param key: The text's key, e.g. ``"menu.goodbye"``.
+        :type key: :obj:`str`
+        :raises KeyError: If there is no such text.
+        """
+        return self._texts[key]
+
+    def text(self, key: str) -> Text:
+        """Parsed and styled text, shared by all its' uses, so it must not be modified.
+
+        :param key: The text's key, e.g. ``"menu.goodbye"``.
+        :type key: :obj:`str`
+        :return: The text.
+        :rtype: :class:`rich.text.Text`
+        :raises KeyError: If there is no such text.
+        """
+        if (text := self._parsed.get(key)) is None:
+            text = self._parsed[key] = render(self._texts[key], emoji=True)
+        return text
+
+
+catalog = Catalog(LANGUAGE)
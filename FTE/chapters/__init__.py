@@ -1,2 +1,18 @@
 # -*- coding: utf-8 -*-
-from .one import chapter_one
+"""
+Chapters of the game. Each chapter is imported when it's entered, not at startup.
+"""
+from importlib import import_module
+
+
+_CHAPTERS: dict[str, str] = dict(chapter_one='.one')  # Chapters and their modules
+
+
+def __getattr__(name: str):
+    if (module := _CHAPTERS.get(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(import_module(module, __name__), name)
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_CHAPTERS]
@@ -11,41 +11,39 @@ Engine Deck
 -----------
 TODO
 """
-from time import sleep
-
-from rich.text import Text
-
+from FTE.catalog import catalog
 from FTE.characters import Character, Standing
-from FTE.console import console
+from FTE.dialogue import Dialogue
+from FTE.events import Event, EventType
 from FTE.locations import Location
-from FTE.settings import DEBUG
+from FTE.results import Message
+from FTE.session import get_session
 from FTE.utils import slow_print, slower_print, story
 from FTE.world import World
 
 
-def chapter_one() -> None:
-    """Plays chapter one."""
-    bridge = Location(
-        'Bridge',
-        'Big fishes spend time here.'
-    )
-    capsules = Location(
-        'Capsules',
-        'You can escape the ship here during an emergency.'
-    )
-    engine_deck = Location(
-        'Engine Deck',
-        'Here engineers make sure the ship is working properly.'
-    )
-    quarters = Location(
-        'Quarters',
-        'All crewmen spend night and freetime here.'
+WAKE_UP: dict = dict(  # Roommate wakes the player up, see :mod:`FTE.dialogue`
+    start='question',
+    nodes=dict(
+        question=dict(ask='one.hevy.dead', retry='one.hevy.silence', replies=dict(yes='yes', no='no')),
+        yes=dict(lines=[['say', 'one.hevy.wake_up', dict(answer='one.hevy.dead.yes')]], next='ready'),
+        no=dict(lines=[['say', 'one.hevy.wake_up', dict(answer='one.hevy.dead.no')]], next='ready'),
+        ready=dict(lines=[['act', 'one.hevy.clothes'], ['say', 'one.hevy.ready'], ['act', 'one.hevy.claps']])
     )
+)
+
 
-    roommate = Character('Hevy', quarters, poke='Good to see you.', standing=Standing.GOOD)
-    capitan = Character('Rex', bridge, poke='Yes sergant? Oh, wait.')
-    pilot = Character('Mixiu', bridge, poke='What the fuck do you want?')
-    engineer = Character('Tech', engine_deck, poke='We should invest in twin ion engines.')
+async def chapter_one() -> None:
+    """Plays chapter one."""
+    bridge = Location('Bridge', catalog['one.bridge'])
+    capsules = Location('Capsules', catalog['one.capsules'])
+    engine_deck = Location('Engine Deck', catalog['one.engine_deck'])
+    quarters = Location('Quarters', catalog['one.quarters'])
+
+    roommate = Character('Hevy', quarters, poke=catalog['one.hevy.poke'], standing=Standing.GOOD)
+    capitan = Character('Rex', bridge, poke=catalog['one.rex.poke'])
+    pilot = Character('Mixiu', bridge, poke=catalog['one.mixiu.poke'])
+    engineer = Character('Tech', engine_deck, poke=catalog['one.tech.poke'])
 
     world = World(
         all_locations=(bridge, capsules, engine_deck, quarters),
@@ -54,54 +52,40 @@ def chapter_one() -> None:
         first_interaction=True
     )
 
+    session = get_session()
+    console = session.console
     console.clear()
-    console.rule('Chapter I')
+    console.rule(catalog.text('one.title'))
     console.print(3 * '\n')
-    for line in [
-        'Year:      3015',
-        'Ship:      Epsilon IV',
-        'Mission:   Who cares?'
-    ]:
-        slow_print(line, end='')
-        slower_print('...')
-    sleep(1.0 if DEBUG else 3.0)
+    for key in ('one.year', 'one.ship', 'one.mission'):
+        await slow_print(catalog[key], end='')
+        await slower_print(catalog['one.ellipsis'])
+    await session.pause(3.0)
 
     console.clear()
-    console.rule('Chapter I')
-    story([
-        'You wake up in your bed, someone is trying to talk to you, '
-        'but you\'re too sleepy to understand.',
-        Text.assemble('You recognize them. I\'s your roommate - ', roommate.display_name, '.'),
-        'He\'s shaking you and after a while you can finally understand him...'
+    console.rule(catalog.text('one.title'))
+    await story([
+        catalog.text('one.wake_up'),
+        Message(catalog['one.recognize'], roommate).renderable,
+        catalog.text('one.shaking')
     ])
-    expect = ('no', 'yes')
-    res = roommate.dialogue('Hey! Man! Are you dead already?')
-    while res not in expect:
-        res = roommate.dialogue('...')
-    char_res = 'Unfortunately no' if res == 'yes' else 'That\'s great'
-    roommate.monologue(f'{char_res}, now wake up and get a move on, of we\'re screwed.')
-    roommate.action('Throws you your clothes.')
-    roommate.monologue('Aight, you ready?')
-    roommate.action('Claps to you.')
-    roommate.monologue(Text.assemble(
-        'We either go to ',
-        capsules.display_name,
-        ' or to ',
-        engine_deck.display_name,
-        ', I don\'t trust our engineers tho.'
-    ))
-    expect = (capsules, engine_deck)
-    roommate.poke = 'There\'s no time, let\'s go!'
-    while res != capsules and res != engine_deck:
-        res = None
-        while res is None:
-            res = world.interaction()
-    if res == capsules:
-        world.character_enters(roommate)
-        roommate.monologue('This ship sucks either way...')
-    else:
-        engineer.monologue('Hey! What are you doing here?')
-        world.character_enters(roommate)
-        roommate.monologue('Don\'t worry, we\'re here to help.')
+    await Dialogue(WAKE_UP).play(roommate)
+    await roommate.monologue(Message(catalog['one.hevy.where'], capsules, engine_deck).renderable)
+    roommate.poke = catalog['one.hevy.hurry']
+
+    async def leave_quarters(event: Event) -> None:
+        for trigger in triggers:
+            world.events.off(trigger)
+        triggers.clear()
+        if event.target == capsules:
+            await world.character_enters(roommate)
+            await roommate.monologue(catalog['one.hevy.capsules'])
+        else:
+            await engineer.monologue(catalog['one.tech.surprised'])
+            await world.character_enters(roommate)
+            await roommate.monologue(catalog['one.hevy.engine_deck'])
 
-    story(['...more coming soon!'])
+    triggers = [world.events.on(EventType.GO, location, leave_quarters) for location in (capsules, engine_deck)]
+    while triggers:
+        await world.interaction()
+    await story([catalog.text('one.more')])
@@ -3,14 +3,14 @@
 Characters are NPCs, with wich the player can interact.
 """
 from enum import IntEnum
-from time import sleep
+from sys import intern
 
 from rich.style import Style
 from rich.text import Text
 
-from FTE.console import console
+from FTE.entities import Entity
 from FTE.locations import Location
-from FTE.settings import DEBUG
+from FTE.session import get_session
 
 
 class Standing(IntEnum):
@@ -19,29 +19,45 @@ class Standing(IntEnum):
     NEUTRAL = 0
     BAD = -10
 
+    @classmethod
+    def of(cls, value: int) -> 'Standing':
+        """Standing of a numeric value, see :class:`FTE.standings.Standings`.
+
+        :param value: The value, at least ``GOOD`` is good and at most ``BAD`` is bad.
+        :type value: :obj:`int`
+        :return: The standing.
+        :rtype: :class:`FTE.characters.Standing`
+        """
+        if value >= cls.GOOD:
+            return cls.GOOD
+        if value <= cls.BAD:
+            return cls.BAD
+        return cls.NEUTRAL
+
     def __str__(self) -> str:
-        if self >= Standing.GOOD:
-            return 'Good'
-        if self <= Standing.BAD:
-            return 'Bad'
-        return 'Neutral'
+        return _NAMES[self]
 
     @property
     def color(self) -> str:
         """Standing color used in :class:`rich.style.Style`."""
-        if self >= Standing.GOOD:
-            return 'green4'
-        if self <= Standing.BAD:
-            return 'red3'
-        return 'sky_blue3'
+        return _COLORS[self]
 
     @property
     def color_text(self) -> Text:
-        """Standing name with color applied."""
-        return Text.assemble(str(self), style=Style(color=self.color))
+        """Standing name with color applied, shared by all its' uses, so it must not be modified."""
+        return _COLOR_TEXTS[self]
+
 
+_NAMES: dict[Standing, str] = {Standing.GOOD: 'Good', Standing.NEUTRAL: 'Neutral', Standing.BAD: 'Bad'}
+_COLORS: dict[Standing, str] = {Standing.GOOD: 'green4', Standing.NEUTRAL: 'sky_blue3', Standing.BAD: 'red3'}
+_COLOR_TEXTS: dict[Standing, Text] = {s: Text(str(s), style=Style(color=s.color)) for s in Standing}
+_NAME_STYLES: dict[Standing, Style] = {s: Style(bold=True, color=s.color) for s in Standing}
+ACTION_STYLE: Style = Style(italic=True)
+
+
+class Character(Entity):
+    __slots__ = ('_location', 'info', 'poke', '_standing', '_slot')
 
-class Character:
     def __init__(
         self,
         name: str,
@@ -67,44 +83,67 @@ class Character:
         :param known: If the player knows this character.
         :type known: :obj:`bool`
         """
-        self.name: str = name
+        super().__init__(name, known=known)
+        self._slot: int | None = None  # Of the world's :class:`FTE.standings.Standings`
         self.location: Location = location
-        self.info: str = info or ''
-        self.poke: str = poke or ''
+        self.info: str = intern(info or '')
+        self.poke: str = intern(poke or '')
         self.standing: Standing = standing or Standing.NEUTRAL
-        self.known: bool = known
 
-    def __eq__(self, other) -> True:
-        if isinstance(other, Character):
-            return self.name == other.name
-        return False
+    @property
+    def location(self) -> Location:
+        """Current character's location."""
+        return self._location
+
+    @location.setter
+    def location(self, value: Location) -> None:
+        old, self._location = getattr(self, '_location', None), value
+        if self._world is not None:
+            self._world._character_moved(self, old)
+
+    @property
+    def standing(self) -> Standing:
+        """How character feels towards the player, derived from the numeric standing kept by the world."""
+        return self._standing
+
+    @standing.setter
+    def standing(self, value: Standing) -> None:
+        if self._world is not None:
+            self._world.standings.set(self, int(value))
+            return
+        self._standing = value
+        self._changed()
 
     @property
-    def display_name(self) -> Text:
-        """Stylized character's name, displays ``"???"`` if character is not known."""
-        return Text.assemble(
-            self.name if self.known else '???',
-            style=Style(
-                bold=True,
-                color=self.standing.color
-            )
-        )
+    def _style(self) -> Style:
+        return _NAME_STYLES[self._standing]
 
     @property
     def pokable(self) -> bool:
         """If character has a poke."""
         return bool(self.poke)
 
-    def monologue(self, text: str | Text) -> None:
+    def quote(self, text: str | Text) -> Text:
+        """Text said by the character, as it is displayed.
+
+        :param text: What the character says.
+        :type text: :obj:`str` or :class:`rich.text.Text`
+        :return: The text with the character's name.
+        :rtype: :class:`rich.text.Text`
+        """
+        return Text.assemble('[ ', self.display_name, ' ] ', '"', text, '"')
+
+    async def monologue(self, text: str | Text) -> None:
         """Character talks towards the player.
 
         :param text: The text chracter will talk to the player.
         :type text: :obj:`str` or :class:`rich.text.Text`
         """
-        console.print(Text.assemble('[ ', self.display_name, ' ] ', '"', text, '"'))
-        sleep(0.0 if DEBUG else 1.5)
+        session = get_session()
+        session.console.print(self.quote(text))
+        await session.pause(1.5)
 
-    def dialogue(self, text: str | Text) -> str:
+    async def dialogue(self, text: str | Text) -> str:
         """Chracter talks towards the player and awaits a response.
 
         :param text: The text chracter will talk to the player.
@@ -112,17 +151,18 @@ class Character:
         :return: Player's response.
         :rtype: :obj:`str`
         """
-        self.monologue(text)
-        return console.input('> ').lower()
+        await self.monologue(text)
+        return (await get_session().input('> ')).lower()
 
-    def action(self, text: str | Text) -> None:
+    async def action(self, text: str | Text) -> None:
         """Character interaction towards the player.
 
         :param text: Action description.
         :type text: :obj:`str` or :class:`rich.text.Text`
         """
-        console.print(Text.assemble(
+        session = get_session()
+        session.console.print(Text.assemble(
             '[ ', self.display_name, ' ] ',
-            Text.assemble('*', text, '*', style=Style(italic=True))
+            Text.assemble('*', text, '*', style=ACTION_STYLE)
         ))
-        sleep(0.0 if DEBUG else 1.5)
+        await session.pause(1.5)
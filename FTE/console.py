@@ -1,8 +1,383 @@
 # -*- coding: utf-8 -*-
 """
 Main game window, handles all input and output.
+
+The game displays everything with one of two interchangeable consoles (backends):
+
+- :class:`GameConsole` renders with rich's full pipeline (measuring, wrapping, terminal detection),
+- :class:`AnsiConsole` writes precomputed ANSI escape sequences (or plain text) of the few styles
+  the game uses, which is much cheaper for pipes, bots and telnet clients.
 """
-from rich.console import Console
+from atexit import register
+from contextlib import contextmanager
+from functools import lru_cache
+from getpass import getpass
+from io import StringIO
+from os import environ
+from shutil import get_terminal_size
+from sys import stdout
+from threading import Lock
+from typing import IO, Callable, Hashable, Iterator
+
+from rich.color import ColorSystem
+from rich.console import COLOR_SYSTEMS, Console
+from rich.emoji import Emoji
+from rich.style import Style
+from rich.text import Text
+
+from FTE.catalog import parse
+from FTE.settings import BUFFERED, CONSOLE
+
+
+class OutputBuffer:
+    """Collects everything written to a stream and writes it at once on :meth:`commit`.
+
+    Regular :meth:`flush` calls are ignored, so many prints cost a single write.
+
+    :param stream: Where the output is finally written.
+    :type stream: :obj:`typing.IO`
+    """
+    def __init__(self, stream: IO[str]) -> None:
+        self._stream: IO[str] = stream
+        self._parts: list[str] = []
+
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+    def write(self, text: str) -> int:
+        self._parts.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        """Does nothing, output is written by :meth:`commit`."""
+
+    def commit(self) -> None:
+        """Writes all collected output to the stream."""
+        if self._parts:
+            text = ''.join(self._parts)
+            self._parts.clear()
+            self._stream.write(text)
+        self._stream.flush()
+
+
+class GameConsole(Console):
+    """Rich console, which optionally buffers output until the player is asked for input.
+
+    :param buffered: If output should be collected and written only on :meth:`flush`.
+    :type buffered: :obj:`bool`
+    :param input_stream: Where the player's input is read from, defaults to standard input.
+    :type input_stream: :obj:`typing.IO`
+    """
+    def __init__(self, *args, buffered: bool = False, input_stream: IO[str] = None, **kwargs) -> None:
+        if buffered:
+            kwargs['file'] = OutputBuffer(kwargs.get('file') or stdout)
+        super().__init__(*args, **kwargs)
+        self.input_stream: IO[str] | None = input_stream
+
+    def flush(self) -> None:
+        """Writes buffered output, e.g. before waiting or asking for input."""
+        if isinstance(self.file, OutputBuffer):
+            self.file.commit()
+        else:
+            self.file.flush()
+
+    def input(self, prompt='', *, markup: bool = True, emoji: bool = True, password: bool = False, stream=None) -> str:
+        """Displays the prompt, writes buffered output and reads a line, like :func:`input`.
+
+        :raises EOFError: If the input stream has ended.
+        """
+        if prompt:
+            self.print(prompt, markup=markup, emoji=emoji, end='')
+        self.flush()
+        if (stream := stream or self.input_stream) is None or password:
+            return super().input(password=password, stream=stream)
+        if not (line := stream.readline()):
+            raise EOFError
+        return line.rstrip('\r\n')
+
+
+@lru_cache(maxsize=256)
+def _parse_style(style: str) -> Style:
+    return Style.parse(style)
+
+
+def style_runs(text: Text) -> Iterator[tuple[str, Style | None]]:
+    """Splits a text into runs of characters with the same style.
+
+    :param text: The text.
+    :type text: :class:`rich.text.Text`
+    :return: Characters and their style, `None` if they have no style.
+    :rtype: :obj:`typing.Iterator` of :obj:`tuple`
+    """
+    plain = text.plain
+    base = _parse_style(text.style) if isinstance(text.style, str) else text.style
+    if not text.spans:
+        if plain:
+            yield plain, base or None
+        return
+    bounds = sorted({0, len(plain), *(min(b, len(plain)) for span in text.spans for b in (span.start, span.end))})
+    for start, end in zip(bounds, bounds[1:]):
+        style = base
+        for span in text.spans:
+            if span.start <= start and end <= span.end:
+                span_style = _parse_style(span.style) if isinstance(span.style, str) else span.style
+                style = style + span_style if style else span_style
+        yield plain[start:end], style or None
+
+
+@lru_cache(maxsize=256)
+def _ansi_codes(style: Style, color_system: ColorSystem) -> tuple[str, str]:
+    """ANSI escape sequences starting and ending a style.
+
+    :param style: The style.
+    :type style: :class:`rich.style.Style`
+    :param color_system: Colors supported by the terminal.
+    :type color_system: :class:`rich.color.ColorSystem`
+    :return: Start and end sequences, empty if the style has no effect.
+    :rtype: :obj:`tuple` of :obj:`str`
+    """
+    start, _, end = style.render('\0', color_system=color_system).partition('\0')
+    return start, end
+
+
+def _detect_color_system() -> str:
+    """Best color system of the terminal, according to environment variables."""
+    if environ.get('COLORTERM', '').lower() in ('truecolor', '24bit'):
+        return 'truecolor'
+    if '256' in environ.get('TERM', ''):
+        return '256'
+    return 'standard'
+
+
+class _Capture:
+    """Output captured by :meth:`AnsiConsole.capture`."""
+    def __init__(self) -> None:
+        self.file: StringIO = StringIO()
+
+    def get(self) -> str:
+        """Captured output."""
+        return self.file.getvalue()
+
+
+RULE_STYLE: Style = Style(color='bright_green')
+
+
+class AnsiConsole:
+    """Lightweight console with the same interface as :class:`GameConsole` for everything the game displays.
+
+    Texts are written with precomputed ANSI escape sequences of their styles, they are
+    neither measured nor wrapped (the terminal wraps long lines). Other renderables,
+    e.g. tables, and justifications other than ``"center"`` are rendered by rich.
+
+    :param file: Where the output is written, defaults to standard output.
+    :type file: :obj:`typing.IO`
+    :param input_stream: Where the player's input is read from, defaults to standard input.
+    :type input_stream: :obj:`typing.IO`
+    :param buffered: If output should be collected and written only on :meth:`flush`.
+    :type buffered: :obj:`bool`
+    :param width: Width of the terminal, defaults to the detected width.
+    :type width: :obj:`int`
+    :param height: Height of the terminal, defaults to the detected height.
+    :type height: :obj:`int`
+    :param color_system: ``"standard"``, ``"256"``, ``"truecolor"``, ``"auto"`` (detected) or `None` for plain text.
+    :type color_system: :obj:`str` or `None`
+    :param force_terminal: If the output is a terminal, defaults to detection.
+    :type force_terminal: :obj:`bool`
+    :param encoding: Encoding of the output, defaults to the file's encoding.
+    :type encoding: :obj:`str`
+    :param highlight: Ignored, texts are never highlighted.
+    :type highlight: :obj:`bool`
+    """
+    def __init__(
+            self,
+            file: IO[str] = None,
+            *,
+            input_stream: IO[str] = None,
+            buffered: bool = False,
+            width: int = None,
+            height: int = None,
+            color_system: str | None = 'auto',
+            force_terminal: bool = None,
+            encoding: str = None,
+            highlight: bool = False
+    ) -> None:
+        file = file or stdout
+        if force_terminal is None:
+            force_terminal = hasattr(file, 'isatty') and file.isatty()
+        size = get_terminal_size() if force_terminal else None
+        self.is_terminal: bool = force_terminal
+        self.file: IO[str] = OutputBuffer(file) if buffered else file
+        self.input_stream: IO[str] | None = input_stream
+        self.width: int = width or (size.columns if size else 80)
+        self.height: int = height or (size.lines if size else 25)
+        if color_system == 'auto':
+            color_system = _detect_color_system() if force_terminal else None
+        self.color_system: str | None = color_system
+        self.encoding: str = (encoding or getattr(file, 'encoding', None) or 'utf-8').lower()
+        self._color_system: ColorSystem | None = COLOR_SYSTEMS.get(color_system)
+        self._rich: Console | None = None  # Renders what the console can't, created on first use
+
+    def _ansi(self, text: Text, style: Style = None) -> str:
+        """Text with ANSI escape sequences of its' styles.
+
+        :param text: The text.
+        :type text: :class:`rich.text.Text`
+        :param style: Style applied below the text's styles.
+        :type style: :class:`rich.style.Style`
+        :return: Ready to write text.
+        :rtype: :obj:`str`
+        """
+        if self._color_system is None:
+            return text.plain
+        pieces = []
+        for run, run_style in style_runs(text):
+            if style:
+                run_style = style + run_style if run_style else style
+            start, end = _ansi_codes(run_style, self._color_system) if run_style else ('', '')
+            pieces.append(f'{start}{run}{end}' if start else run)
+        return ''.join(pieces)
+
+    def print(
+            self,
+            *objects,
+            sep: str = ' ',
+            end: str = '\n',
+            style: str | Style = None,
+            justify: str = None,
+            markup: bool = True,
+            emoji: bool = True
+    ) -> None:
+        """Displays objects, like :meth:`rich.console.Console.print`.
+
+        Strings are parsed as markup (unless ``markup`` is `False`) with emoji shortcodes
+        (unless ``emoji`` is `False`). Texts are justified only to ``"center"``, other
+        justifications and renderables are printed by rich.
+        """
+        if justify not in (None, 'center') or not all(isinstance(o, (str, Text)) for o in objects):
+            if (console := self._rich) is None:
+                console = self._rich = Console(
+                    file=self.file,
+                    width=self.width,
+                    color_system=self.color_system,
+                    force_terminal=self.is_terminal,
+                    highlight=False
+                )
+            console.file = self.file  # Replaced while capturing
+            console.print(*objects, sep=sep, end=end, style=style, justify=justify, markup=markup, emoji=emoji)
+            return
+        texts = [
+            (parse(o, emoji) if markup else Text(Emoji.replace(o) if emoji else o)) if isinstance(o, str) else o
+            for o in objects
+        ]
+        text = texts[0] if len(texts) == 1 else Text(sep).join(texts)
+        if isinstance(style, str):
+            style = _parse_style(style)
+        if justify == 'center':
+            output = '\n'.join(
+                ' ' * max(0, (self.width - line.cell_len) // 2) + self._ansi(line, style) if line else ''
+                for line in text.split('\n', allow_blank=True)
+            )
+        else:
+            output = self._ansi(text, style)
+        self.file.write(output + end)
+
+    def rule(self, title: str | Text = '') -> None:
+        """Draws a horizontal line with an optional title in the middle.
+
+        :param title: The title.
+        :type title: :obj:`str` or :class:`rich.text.Text`
+        """
+        char = '─' if self.encoding.startswith('utf') else '-'
+        title = parse(title) if isinstance(title, str) else title
+        if not (title_width := title.cell_len):
+            self.file.write(self._ansi(Text(char * self.width), RULE_STYLE) + '\n')
+            return
+        left = (self.width - title_width - 2) // 2
+        right = self.width - title_width - 2 - left
+        self.file.write(
+            self._ansi(Text(char * left), RULE_STYLE) + ' ' + self._ansi(title) + ' '
+            + self._ansi(Text(char * right), RULE_STYLE) + '\n'
+        )
+
+    def clear(self) -> None:
+        """Clears the terminal, does nothing if the output is not a terminal."""
+        if self.is_terminal:
+            self.file.write('\x1b[2J\x1b[H')
+
+    @contextmanager
+    def capture(self) -> Iterator[_Capture]:
+        """Captures output instead of writing it, like :meth:`rich.console.Console.capture`."""
+        capture, file = _Capture(), self.file
+        self.file = capture.file
+        try:
+            yield capture
+        finally:
+            self.file = file
+
+    def flush(self) -> None:
+        """See :meth:`GameConsole.flush`."""
+        if isinstance(self.file, OutputBuffer):
+            self.file.commit()
+        else:
+            self.file.flush()
+
+    def input(self, prompt: str | Text = '', *, markup: bool = True, emoji: bool = True, password: bool = False, stream=None) -> str:
+        """See :meth:`GameConsole.input`."""
+        if prompt:
+            self.print(prompt, markup=markup, emoji=emoji, end='')
+        self.flush()
+        if (stream := stream or self.input_stream) is None:
+            return getpass('') if password else input()
+        if not (line := stream.readline()):
+            raise EOFError
+        return line.rstrip('\r\n')
+
+
+CONSOLES: dict[str, type] = dict(rich=GameConsole, ansi=AnsiConsole)  # Consoles selectable by name
+
+
+class RenderCache:
+    """Final output of static drawings, e.g. help tables or banners.
+
+    A drawing is rendered once for each width, color system and encoding of consoles,
+    then drawing it again costs a single write. The cache can be shared by sessions
+    played in different threads, its' outputs are changed under a lock.
+
+    :param size: Maximum number of cached outputs, the oldest ones are forgotten first.
+    :type size: :obj:`int`
+    """
+    def __init__(self, size: int = 64) -> None:
+        self._size: int = size
+        self._outputs: dict[Hashable, str] = {}
+        self._lock: Lock = Lock()
+
+    def draw(self, console: Console, key: Hashable, draw: Callable[[], None]) -> None:
+        """Writes cached output of a drawing, or draws it and caches its' output.
+
+        :param console: Where to draw.
+        :type console: :class:`rich.console.Console`
+        :param key: Identifies the drawing, must change when the drawing's contents change.
+        :type key: :obj:`typing.Hashable`
+        :param draw: Draws on the console.
+        :type draw: :obj:`typing.Callable`
+        """
+        key = (key, console.width, console.color_system, console.encoding)
+        if (output := self._outputs.get(key)) is None:
+            with console.capture() as capture:
+                draw()
+            output = capture.get()
+            with self._lock:
+                while len(self._outputs) >= self._size:
+                    del self._outputs[next(iter(self._outputs))]
+                self._outputs[key] = output
+        console.file.write(output)
+
+    def clear(self) -> None:
+        """Forgets all cached outputs."""
+        with self._lock:
+            self._outputs.clear()
 
 
-console = Console(highlight=False)
+render_cache = RenderCache()  # Shared by all sessions, as outputs are keyed by consoles' properties
+console = CONSOLES[CONSOLE](highlight=False, buffered=BUFFERED)
+register(console.flush)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Conversations with characters, loaded from data instead of written as input loops.
+
+A conversation is a :obj:`dict` (or a JSON file) of nodes, texts are keys of :data:`FTE.catalog.catalog`::
+
+    {
+        "start": "question",
+        "nodes": {
+            "question": {"ask": "one.hevy.dead", "retry": "one.hevy.silence", "replies": {"yes": "yes", "no": "no"}},
+            "yes": {"lines": [["say", "one.hevy.wake_up", {"answer": "one.hevy.dead.yes"}]], "next": "ready"},
+            ...
+        }
+    }
+
+A node plays its' ``lines`` (``say`` is :meth:`FTE.characters.Character.monologue`,
+``act`` is :meth:`FTE.characters.Character.action`), then asks its' question
+(:meth:`FTE.characters.Character.dialogue`) and goes to the node of the player's
+reply, repeating ``retry`` until the reply is accepted. Nodes without replies go to
+their ``next`` node, or end the conversation. Nodes without replies mustn't form a cycle,
+which would never wait for the player.
+
+Conversations are compiled once: texts are looked up and formatted, node names become
+:obj:`int` IDs and accepted replies are normalized into :obj:`dict` tables, so a reply
+costs a single lookup. A conversation can be saved as its' current node's ID and resumed later.
+"""
+from json import loads
+from pathlib import Path
+
+from FTE.catalog import catalog
+from FTE.characters import Character
+from FTE.entities import fold
+
+
+class InvalidDialogue(BaseException):
+    """Conversation's data is malformed, e.g. a reply leads to a missing node."""
+
+
+def normalize(reply: str) -> str:
+    """Normalizes a player's reply, so case and extra spaces don't matter.
+
+    :param reply: The reply.
+    :type reply: :obj:`str`
+    :return: Normalized reply.
+    :rtype: :obj:`str`
+    """
+    return ' '.join(fold(reply).split())
+
+
+class _Node:
+    """Compiled node of a :class:`Dialogue`."""
+    __slots__ = ('lines', 'ask', 'retry', 'replies', 'next')
+
+    def __init__(
+            self,
+            lines: tuple[tuple[str, str], ...],
+            ask: str | None,
+            retry: str | None,
+            replies: dict[str, int],
+            next: int | None
+    ) -> None:
+        self.lines: tuple[tuple[str, str], ...] = lines  # Kinds of lines and their texts
+        self.ask: str | None = ask
+        self.retry: str | None = retry
+        self.replies: dict[str, int] = replies  # Normalized replies mapped to IDs of following nodes
+        self.next: int | None = next
+
+
+class Dialogue:
+    """Compiled conversation.
+
+    :param data: The conversation's nodes, see :mod:`FTE.dialogue`.
+    :type data: :obj:`dict`
+    :raises InvalidDialogue: If the data is malformed.
+    """
+    def __init__(self, data: dict) -> None:
+        if not isinstance(data, dict) or not isinstance(nodes := data.get('nodes', {}), dict):
+            raise InvalidDialogue('A conversation must be a dict with a dict of nodes.')
+        self.names: tuple[str, ...] = tuple(nodes)  # Node names by their IDs
+        self._ids: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.start: int = self.id(data.get('start', next(iter(nodes), '')))
+        self._nodes: tuple[_Node, ...] = tuple(self._compile(name, node) for name, node in nodes.items())
+        self._check_cycles()
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'Dialogue':
+        """Loads a conversation from a JSON file.
+
+        :param path: The file.
+        :type path: :obj:`str` or :class:`pathlib.Path`
+        :return: The conversation.
+        :rtype: :class:`FTE.dialogue.Dialogue`
+        :raises InvalidDialogue: If the data is malformed.
+        """
+        return cls(loads(Path(path).read_text(encoding='utf-8')))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def id(self, name: str) -> int:
+        """ID of a node.
+
+        :param name: The node's name.
+        :type name: :obj:`str`
+        :return: The node's ID.
+        :rtype: :obj:`int`
+        :raises InvalidDialogue: If there is no such node.
+        """
+        if not isinstance(name, str) or (i := self._ids.get(name)) is None:
+            raise InvalidDialogue(f'There is no node "{name}".')
+        return i
+
+    @staticmethod
+    def _text(key: str, placeholders: dict[str, str] = None) -> str:
+        """Text of a catalog key, with named placeholders filled by texts of other keys.
+
+        :param key: The key.
+        :type key: :obj:`str`
+        :param placeholders: Names of placeholders mapped to keys.
+        :type placeholders: :obj:`dict`
+        :return: The text.
+        :rtype: :obj:`str`
+        :raises InvalidDialogue: If a key is missing in the catalog.
+        """
+        for k in (key, *(placeholders or {}).values()):
+            if not isinstance(k, str):
+                raise InvalidDialogue(f'Texts must be keys of the catalog, not {k!r}.')
+        try:
+            text = catalog[key]
+            return text.format(**{name: catalog[k] for name, k in placeholders.items()}) if placeholders else text
+        except KeyError as error:
+            raise InvalidDialogue(f'There is no text {error}.') from None
+
+    def _compile(self, name: str, node: dict) -> _Node:
+        """Compiles a node.
+
+        :param name: The node's name.
+        :type name: :obj:`str`
+        :param node: The node's data.
+        :type node: :obj:`dict`
+        :return: The compiled node.
+        :rtype: :class:`FTE.dialogue._Node`
+        :raises InvalidDialogue: If the node is malformed.
+        """
+        if not isinstance(node, dict):
+            raise InvalidDialogue(f'Node "{name}" must be a dict.')
+        if not isinstance(node.get('lines', ()), (list, tuple)):
+            raise InvalidDialogue(f'Node "{name}" must have lines as a list.')
+        lines = []
+        for line in node.get('lines', ()):
+            if not isinstance(line, (list, tuple)) or not 2 <= len(line) <= 3 or (
+                    len(line) == 3 and not isinstance(line[2], dict)):
+                raise InvalidDialogue(f'Node "{name}" has a malformed line {line!r}, expected [kind, key, {{placeholders}}].')
+            kind, key, *placeholders = line
+            if kind not in ('say', 'act'):
+                raise InvalidDialogue(f'Node "{name}" has a line of unknown kind "{kind}".')
+            lines.append((kind, self._text(key, *placeholders)))
+        if not isinstance(replies := node.get('replies', {}), dict) or not all(isinstance(r, str) for r in replies):
+            raise InvalidDialogue(f'Node "{name}" must have replies as a dict of texts.')
+        replies = {normalize(reply): self.id(following) for reply, following in replies.items()}
+        if bool(replies) != ('ask' in node):
+            raise InvalidDialogue(f'Node "{name}" must have both a question and replies, or neither.')
+        ask = self._text(node['ask']) if 'ask' in node else None
+        return _Node(
+            tuple(lines),
+            ask,
+            self._text(node['retry']) if 'retry' in node else ask,
+            replies,
+            self.id(node['next']) if 'next' in node else None
+        )
+
+    def _check_cycles(self) -> None:
+        """Makes sure every chain of nodes without replies ends, or reaches a question.
+
+        :raises InvalidDialogue: If nodes without replies form a cycle.
+        """
+        ending: set[int] = set()  # Nodes which end or reach a question
+        for start in range(len(self._nodes)):
+            chain, node = set(), start
+            while node is not None and node not in ending and self._nodes[node].ask is None:
+                if node in chain:
+                    raise InvalidDialogue(f'Node "{self.names[node]}" leads back to itself without asking the player.')
+                chain.add(node)
+                node = self._nodes[node].next
+            ending |= chain
+
+    async def step(self, character: Character, node: int) -> int | None:
+        """Plays a single node of the conversation.
+
+        :param character: Who the player talks to.
+        :type character: :class:`FTE.characters.Character`
+        :param node: ID of the node.
+        :type node: :obj:`int`
+        :return: ID of the following node, `None` if the conversation ended.
+        :rtype: :obj:`int` or `None`
+        """
+        compiled = self._nodes[node]
+        for kind, text in compiled.lines:
+            if kind == 'say':
+                await character.monologue(text)
+            else:
+                await character.action(text)
+        if compiled.ask is None:
+            return compiled.next
+        following = compiled.replies.get(normalize(await character.dialogue(compiled.ask)))
+        while following is None:
+            following = compiled.replies.get(normalize(await character.dialogue(compiled.retry)))
+        return following
+
+    async def play(self, character: Character, node: int = None) -> int:
+        """Plays the conversation until it ends.
+
+        :param character: Who the player talks to.
+        :type character: :class:`FTE.characters.Character`
+        :param node: ID of the node to resume from, defaults to the start.
+        :type node: :obj:`int`
+        :return: ID of the last played node.
+        :rtype: :obj:`int`
+        """
+        following = self.start if node is None else node
+        while following is not None:
+            node, following = following, await self.step(character, following)
+        return node
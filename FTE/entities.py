@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Entities are named game objects (locations, characters, commands), which the world indexes by name.
+"""
+from itertools import count
+from sys import intern
+
+from rich.style import Style
+from rich.text import Text
+
+
+_ids = count(1)  # Entity IDs are never reused during the process' lifetime
+PLAIN: Style = Style()
+
+
+def fold(name: str) -> str:
+    """Normalizes a name for case-insensitive lookups.
+
+    :param name: The name to normalize.
+    :type name: :obj:`str`
+    :return: Case-folded name.
+    :rtype: :obj:`str`
+    """
+    return name.casefold()
+
+
+class Entity:
+    """Base of everything the player can find by name.
+
+    Every entity gets a unique integer ID at creation, used for equality and hashing,
+    so entities can be used as :obj:`set` members and :obj:`dict` keys.
+    When the entity's name changes or it becomes (un)known, the world it belongs to is notified,
+    so its name indexes stay up to date.
+
+    Worlds can hold hundreds of thousands of entities, so entities have no instance :obj:`dict`
+    (subclasses must declare ``__slots__`` too) and their texts are interned, equal texts are stored once.
+    A location takes at most 128 bytes, a character at most 160 bytes, not counting unique texts
+    (see ``memory.location`` and ``memory.character`` benchmarks, which fail over these budgets).
+
+    Stylized name is created on first use and reused until something displayed changes.
+
+    :param name: The entity's name.
+    :type name: :obj:`str`
+    :param known: If the entity is known to the player.
+    :type known: :obj:`bool`
+    """
+    __slots__ = ('id', '_world', '_name', '_known', '_display_name')
+
+    def __init__(
+            self,
+            name: str,
+            *,
+            known: bool = True
+    ) -> None:
+        self.id: int = next(_ids)
+        self._world = None
+        self._name: str = intern(name)
+        self._known: bool = known
+        self._display_name: Text | None = None
+
+    @property
+    def name(self) -> str:
+        """The entity's name."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        old, self._name = self._name, intern(value)
+        self._changed()
+        if self._world is not None and old != value:
+            self._world._entity_renamed(self, old)
+
+    @property
+    def known(self) -> bool:
+        """If the entity is known to the player."""
+        return self._known
+
+    @known.setter
+    def known(self, value: bool) -> None:
+        old, self._known = self._known, value
+        self._changed()
+        if self._world is not None and old != value:
+            self._world._entity_known_changed(self)
+
+    @property
+    def _style(self) -> Style:
+        """Style of :attr:`display_name`."""
+        return PLAIN
+
+    @property
+    def display_name(self) -> Text:
+        """Stylized entity's name, ``"???"`` if the entity is not known.
+        The text is shared by all its' uses, so it must not be modified."""
+        if (text := self._display_name) is None:
+            text = self._display_name = Text(self._name if self._known else '???', style=self._style)
+        return text
+
+    def _changed(self) -> None:
+        """Forgets cached renderables after something displayed changed."""
+        self._display_name = None
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Entity):
+            return self.id == other.id
+        return False
+
+    def __hash__(self) -> int:
+        return self.id
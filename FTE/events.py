@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Events are things which happened in the world, e.g. the player went somewhere.
+
+Chapters react to events with triggers, registered for an event type and a target::
+
+    world.events.on(EventType.GO, capsules, escape, once=True)
+
+Triggers are indexed by their type and target, so an event is matched only
+against its' own triggers, no matter how many triggers a chapter registers.
+
+Triggers which talk to the player are coroutine functions, they are awaited by
+:meth:`EventBus.dispatch_async`, e.g. in :meth:`FTE.world.World.interaction`.
+"""
+from enum import Enum
+from inspect import isawaitable
+from typing import Callable, Hashable, Iterator
+
+
+class EventType(Enum):
+    """What kind of thing happened."""
+    GO = 'go'
+    TALK = 'talk'
+    CHARACTER_MOVED = 'character_moved'
+    STANDING_CHANGED = 'standing_changed'
+
+
+class Event:
+    """Represents something which happened in the world.
+
+    :param type: What kind of thing happened.
+    :type type: :class:`FTE.events.EventType`
+    :param target: The entity it happened to, e.g. the location the player went to.
+    :type target: :class:`FTE.entities.Entity`
+    """
+    __slots__ = ('type', 'target')
+
+    def __init__(self, type: EventType, target) -> None:
+        self.type: EventType = type
+        self.target = target
+
+    def __repr__(self) -> str:
+        return f'Event({self.type.name}, {self.target.name!r})'
+
+
+class Trigger:
+    """Reaction to events of a type and target, see :meth:`EventBus.on`."""
+    __slots__ = ('key', 'handler', 'once')
+
+    def __init__(self, key: tuple[EventType, Hashable], handler: Callable[[Event], None], once: bool) -> None:
+        self.key: tuple[EventType, Hashable] = key
+        self.handler: Callable[[Event], None] = handler
+        self.once: bool = once
+
+    def __repr__(self) -> str:
+        return f'Trigger({self.key[0].name}, {self.handler.__name__!r})'
+
+
+class EventBus:
+    """Delivers events to triggers.
+
+    Events are posted while things happen, e.g. during :meth:`FTE.world.World.execute`,
+    and dispatched later, e.g. after the result of the player's command is displayed.
+    Events without triggers are dropped right away.
+    """
+    def __init__(self) -> None:
+        self._triggers: dict[tuple[EventType, Hashable], dict[Trigger, None]] = {}
+        self._counts: dict[EventType, int] = dict.fromkeys(EventType, 0)  # Triggers of every type
+        self._pending: list[Event] = []
+
+    def __len__(self) -> int:
+        """Number of registered triggers."""
+        return sum(self._counts.values())
+
+    def on(
+            self,
+            type: EventType,
+            target: Hashable | None,
+            handler: Callable[[Event], None],
+            *,
+            once: bool = False
+    ) -> Trigger:
+        """Registers a trigger.
+
+        :param type: Type of events the trigger reacts to.
+        :type type: :class:`FTE.events.EventType`
+        :param target: Target of events the trigger reacts to, `None` for any target.
+        :type target: :obj:`typing.Hashable` or `None`
+        :param handler: Called with every matching event.
+        :type handler: :obj:`typing.Callable`
+        :param once: If the trigger is removed after its' first event.
+        :type once: :obj:`bool`
+        :return: The trigger, to remove it by :meth:`off`.
+        :rtype: :class:`FTE.events.Trigger`
+        """
+        trigger = Trigger((type, target), handler, once)
+        self._triggers.setdefault(trigger.key, {})[trigger] = None
+        self._counts[type] += 1
+        return trigger
+
+    def off(self, trigger: Trigger) -> None:
+        """Removes a trigger, if it's registered.
+
+        :param trigger: The trigger.
+        :type trigger: :class:`FTE.events.Trigger`
+        """
+        if (triggers := self._triggers.get(trigger.key)) is None or trigger not in triggers:
+            return
+        del triggers[trigger]
+        self._counts[trigger.key[0]] -= 1
+        if not triggers:
+            del self._triggers[trigger.key]
+
+    def listens(self, type: EventType) -> bool:
+        """Whether any trigger reacts to events of a type, so bulk changes can skip posting events.
+
+        :param type: The type.
+        :type type: :class:`FTE.events.EventType`
+        """
+        return self._counts[type] > 0
+
+    def post(self, type: EventType, target) -> None:
+        """Queues an event until :meth:`dispatch`, if any trigger reacts to it.
+
+        :param type: What kind of thing happened.
+        :type type: :class:`FTE.events.EventType`
+        :param target: The entity it happened to.
+        :type target: :class:`FTE.entities.Entity`
+        """
+        if self._counts[type] and ((type, target) in self._triggers or (type, None) in self._triggers):
+            self._pending.append(Event(type, target))
+
+    def _matching(self, event: Event) -> tuple[Trigger, ...]:
+        """Triggers reacting to an event, the ones registered for its' target first.
+
+        :param event: The event.
+        :type event: :class:`FTE.events.Event`
+        :return: The triggers.
+        :rtype: :obj:`tuple` of :class:`FTE.events.Trigger`
+        """
+        return (
+            *self._triggers.get((event.type, event.target), ()),
+            *(self._triggers.get((event.type, None), ()) if event.target is not None else ())
+        )
+
+    def _firing(self) -> Iterator[tuple[Trigger | None, Event]]:
+        """Triggers of queued events, in order the events were posted, each event ends with a `None` trigger.
+        Events posted by the triggers' handlers meanwhile are included.
+
+        :return: Triggers and their events.
+        :rtype: :obj:`typing.Iterator` of :obj:`tuple`
+        """
+        while self._pending:
+            pending, self._pending = self._pending, []
+            for event in pending:
+                for trigger in self._matching(event):
+                    if trigger not in self._triggers.get(trigger.key, ()):
+                        continue  # Removed by a previous handler
+                    if trigger.once:
+                        self.off(trigger)
+                    yield trigger, event
+                yield None, event
+
+    def dispatch(self) -> int:
+        """Calls triggers of queued events, in order the events were posted.
+        Events posted by the triggers are dispatched too.
+
+        :return: Number of dispatched events.
+        :rtype: :obj:`int`
+        :raises TypeError: If a trigger is a coroutine function, see :meth:`dispatch_async`.
+        """
+        dispatched = 0
+        for trigger, event in self._firing():
+            if trigger is None:
+                dispatched += 1
+            elif isawaitable(reaction := trigger.handler(event)):
+                reaction.close()
+                raise TypeError(f'{trigger!r} must be awaited, dispatch it with dispatch_async().')
+        return dispatched
+
+    async def dispatch_async(self) -> int:
+        """Like :meth:`dispatch`, but awaits triggers which are coroutine functions.
+
+        :return: Number of dispatched events.
+        :rtype: :obj:`int`
+        """
+        dispatched = 0
+        for trigger, event in self._firing():
+            if trigger is None:
+                dispatched += 1
+            elif isawaitable(reaction := trigger.handler(event)):
+                await reaction
+        return dispatched
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+The whole game, from the main menu through all chapters.
+"""
+from FTE import chapters
+from FTE.menus import main_menu
+from FTE.settings import DEBUG
+
+
+async def play() -> None:
+    """Plays the game in the current session."""
+    if not DEBUG:
+        await main_menu()
+    await chapters.chapter_one()
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Doors between locations. The player can go only to neighbouring locations,
+farther locations are reached through the shortest route of doors::
+
+    graph = LocationGraph()
+    graph.open_door(quarters, bridge)
+    graph.route(quarters, bridge)  # [bridge]
+
+A world without doors is fully connected, every location is a neighbour of all others.
+"""
+from FTE.locations import Location
+
+
+class _Tree:
+    """Shortest routes from a single location to all reachable locations, found by breadth-first search."""
+    __slots__ = ('parents', 'distances')
+
+    def __init__(self, doors: dict[Location, dict[Location, None]], source: Location) -> None:
+        self.parents: dict[Location, Location | None] = {source: None}
+        self.distances: dict[Location, int] = {source: 0}
+        frontier = [source]
+        while frontier:
+            following = []
+            for location in frontier:
+                distance = self.distances[location] + 1
+                for neighbour in doors.get(location, ()):
+                    if neighbour not in self.parents:
+                        self.parents[neighbour] = location
+                        self.distances[neighbour] = distance
+                        following.append(neighbour)
+            frontier = following
+
+    def uses(self, a: Location, b: Location) -> bool:
+        """Whether a door is a part of any route.
+
+        :param a: Location on one side of the door.
+        :type a: :class:`FTE.locations.Location`
+        :param b: Location on the other side of the door.
+        :type b: :class:`FTE.locations.Location`
+        """
+        return self.parents.get(a) is b or self.parents.get(b) is a
+
+    def shortens(self, a: Location, b: Location) -> bool:
+        """Whether a new door would make any route shorter.
+
+        :param a: Location on one side of the door.
+        :type a: :class:`FTE.locations.Location`
+        :param b: Location on the other side of the door.
+        :type b: :class:`FTE.locations.Location`
+        """
+        distance_a, distance_b = self.distances.get(a), self.distances.get(b)
+        if distance_a is None or distance_b is None:
+            return (distance_a is None) != (distance_b is None)
+        return abs(distance_a - distance_b) > 1
+
+
+class LocationGraph:
+    """Locations connected by doors, which can be opened and closed during the game.
+
+    Shortest routes from the most recently used locations are cached. Opening or closing
+    a door forgets only cached routes, which the door changes.
+
+    :param doors: Pairs of locations connected by doors, the player can go both ways.
+    :type doors: :obj:`list` of :obj:`tuple`
+    :param size: Maximum number of locations with cached routes, the least recently used ones are forgotten first.
+    :type size: :obj:`int`
+    """
+    def __init__(self, doors: list[tuple[Location, Location]] = None, size: int = 64) -> None:
+        self._doors: dict[Location, dict[Location, None]] = {}
+        self._count: int = 0
+        self._size: int = size
+        self._trees: dict[Location, _Tree] = {}
+        for a, b in doors or ():
+            self.open_door(a, b)
+
+    def __len__(self) -> int:
+        """Number of open doors."""
+        return self._count
+
+    def neighbours(self, location: Location) -> tuple[Location, ...]:
+        """Locations behind the doors of a location, in order the doors were opened.
+
+        :param location: The location.
+        :type location: :class:`FTE.locations.Location`
+        :return: The neighbouring locations.
+        :rtype: :obj:`tuple` of :class:`FTE.locations.Location`
+        """
+        return tuple(self._doors.get(location, ()))
+
+    def connected(self, a: Location, b: Location) -> bool:
+        """Whether there is an open door between two locations.
+
+        :param a: Location on one side of the door.
+        :type a: :class:`FTE.locations.Location`
+        :param b: Location on the other side of the door.
+        :type b: :class:`FTE.locations.Location`
+        """
+        return b in self._doors.get(a, ())
+
+    def open_door(self, a: Location, b: Location) -> None:
+        """Connects two locations, if they aren't connected yet.
+
+        :param a: Location on one side of the door.
+        :type a: :class:`FTE.locations.Location`
+        :param b: Location on the other side of the door.
+        :type b: :class:`FTE.locations.Location`
+        """
+        if a is b or self.connected(a, b):
+            return
+        self._doors.setdefault(a, {})[b] = None
+        self._doors.setdefault(b, {})[a] = None
+        self._count += 1
+        self._forget(lambda tree: tree.shortens(a, b))
+
+    def close_door(self, a: Location, b: Location) -> None:
+        """Disconnects two locations, if they are connected.
+
+        :param a: Location on one side of the door.
+        :type a: :class:`FTE.locations.Location`
+        :param b: Location on the other side of the door.
+        :type b: :class:`FTE.locations.Location`
+        """
+        if not self.connected(a, b):
+            return
+        del self._doors[a][b]
+        del self._doors[b][a]
+        self._count -= 1
+        self._forget(lambda tree: tree.uses(a, b))
+
+    def _forget(self, changed) -> None:
+        """Forgets cached routes, which a door changed.
+
+        :param changed: Tells if a door changed routes of a :class:`_Tree`.
+        :type changed: :obj:`typing.Callable`
+        """
+        for source in [source for source, tree in self._trees.items() if changed(tree)]:
+            del self._trees[source]
+
+    def _tree(self, source: Location) -> _Tree:
+        """Shortest routes from a location, cached.
+
+        :param source: The location.
+        :type source: :class:`FTE.locations.Location`
+        :return: The routes.
+        :rtype: :class:`FTE.graph._Tree`
+        """
+        if (tree := self._trees.pop(source, None)) is None:
+            tree = _Tree(self._doors, source)
+            if len(self._trees) >= self._size:
+                del self._trees[next(iter(self._trees))]
+        self._trees[source] = tree  # Most recently used last
+        return tree
+
+    def distance(self, start: Location, goal: Location) -> int | None:
+        """How many doors the player must go through.
+
+        :param start: Where the player is.
+        :type start: :class:`FTE.locations.Location`
+        :param goal: Where the player wants to go.
+        :type goal: :class:`FTE.locations.Location`
+        :return: Number of doors, `None` if the goal can't be reached.
+        :rtype: :obj:`int` or `None`
+        """
+        return self._tree(start).distances.get(goal)
+
+    def route(self, start: Location, goal: Location) -> list[Location] | None:
+        """Finds the shortest route between two locations.
+
+        :param start: Where the player is.
+        :type start: :class:`FTE.locations.Location`
+        :param goal: Where the player wants to go.
+        :type goal: :class:`FTE.locations.Location`
+        :return: Locations the player goes through, ending with the goal, `None` if the goal can't be reached.
+        :rtype: :obj:`list` of :class:`FTE.locations.Location` or `None`
+        """
+        parents = self._tree(start).parents
+        if goal not in parents:
+            return None
+        route = []
+        while goal is not start:
+            route.append(goal)
+            goal = parents[goal]
+        route.reverse()
+        return route
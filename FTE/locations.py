@@ -3,11 +3,17 @@
 Location is an object, which stores characters. Any NPC character could be in
 any location, but player must be only in a single location.
 """
+from sys import intern
+
 from rich.style import Style
-from rich.text import Text
 
+from FTE.entities import Entity
+
+
+STYLE: Style = Style(bold=True, color='magenta')  # Style of locations' names
 
-class Location:
+
+class Location(Entity):
     """Represents a location inside the game.
 
     :param name: The location's name.
@@ -17,6 +23,8 @@ class Location:
     :param known: If location is known to the player.
     :type known: :obj:`bool`
     """
+    __slots__ = ('info',)
+
     def __init__(
             self,
             name: str,
@@ -24,27 +32,9 @@ class Location:
             *,
             known: bool = True
     ) -> None:
-        self.name: str = name
-        self.info: str = info or ''
-        self.known: bool = known
+        super().__init__(name, known=known)
+        self.info: str = intern(info or '')
 
     @property
-    def display_name(self) -> Text:
-        """Stylized location's name, or ``"???"`` if location is not known."""
-        return Text.assemble(
-            self.name if self.known else '???',
-            style=Style(
-                bold=True,
-                color='magenta'
-            )
-        )
-
-    def __eq__(self, other) -> bool:
-        if isinstance(other, Location):
-            return self.name == other.name
-        return False
-
-    def __ne__(self, other) -> bool:
-        if isinstance(other, Location):
-            return self.name != other.name
-        return True
+    def _style(self) -> Style:
+        return STYLE
@@ -2,19 +2,15 @@
 """
 Displays menu's. Currently only main menu to start or exit the game.
 """
+from rich.console import Console
 from rich.style import Style
 
-from time import sleep
+from FTE.catalog import catalog
+from FTE.console import render_cache
+from FTE.session import get_session
 
-from FTE.console import console
 
-
-def main_menu() -> None:
-    """Displays main menu."""
-    while True:
-        console.clear()
-        console.rule('Main menu')
-        console.print('''
+BANNER: str = '''
 \u00a0_____  ____  __ __      ______  __ __    ___        ___  ____    ____  ____  ____     ___  _____
 |     ||    ||  |  |    |      ||  |  |  /  _]      /  _]|    \  /    ||    ||    \   /  _]/ ___/
 |   __| |  | |  |  |    |      ||  |  | /  [_      /  [_ |  _  ||   __| |  | |  _  | /  [_(   \_
@@ -22,18 +18,33 @@ def main_menu() -> None:
 |   _]  |  | |     |      |  |  |  |  ||   [_     |   [_ |  |  ||  |_ | |  | |  |  ||   [_ /  \ |
 |  |    |  | |  |  |      |  |  |  |  ||     |    |     ||  |  ||     | |  | |  |  ||     |\    |
 |__|   |____||__|__|      |__|  |__|__||_____|    |_____||__|__||___,_||____||__|__||_____| \___|
-''',
-            justify='center',
-            style=Style(
-                bold=True
-        ))
-        console.print('1. Let\'s fix them!')
-        console.print('2. Maybe later...')
+'''
+
+
+def _draw_banner(console: Console) -> None:
+    """Draws main menu's title and banner.
+
+    :param console: Where to draw.
+    :type console: :class:`rich.console.Console`
+    """
+    console.rule(catalog.text('menu.title'))
+    console.print(BANNER, justify='center', style=Style(bold=True))
+
+
+async def main_menu() -> None:
+    """Displays main menu."""
+    session = get_session()
+    console = session.console
+    while True:
+        console.clear()
+        render_cache.draw(console, 'main menu', lambda: _draw_banner(console))
+        console.print(catalog.text('menu.start'))
+        console.print(catalog.text('menu.later'))
         console.print('')
-        choice = console.input('Your choice? ')
+        choice = await session.input(catalog.text('menu.choice'))
         if choice == '1':
             break
         elif choice == '2':
-            console.print(':wave: Goodbye!')
-            sleep(3.0)
+            console.print(catalog.text('menu.goodbye'))
+            await session.pause(3.0)
             exit()
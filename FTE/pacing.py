@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Pacing of the game. Every delay between displayed texts goes through :meth:`FTE.session.Session.pause`,
+which asks the session's clock to wait.
+
+Clocks:
+
+- :class:`RealClock` -- waits in real time, as the story was written,
+- :class:`ScaledClock` -- waits a fraction (or multiple) of real time, e.g. ``0.1``,
+- :class:`VirtualClock` -- doesn't wait at all, only counts how long the player would wait.
+
+Waiting is awaited. Under an event loop (e.g. :mod:`FTE.server`) the loop plays other
+sessions meanwhile, the terminal game runs without a loop (see :func:`FTE.session.run_blocking`)
+and simply sleeps, as nothing else waits for the process.
+"""
+from sys import modules
+from time import monotonic, sleep
+
+
+def _loop_running() -> bool:
+    """If the caller runs in an event loop, checked without importing :mod:`asyncio` at startup."""
+    if (asyncio := modules.get('asyncio')) is None:
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class Clock:
+    """Base of all clocks, decides how long the game waits."""
+    async def sleep(self, seconds: float) -> None:
+        """Waits for the desired time.
+
+        :param seconds: Story time to wait.
+        :type seconds: :obj:`float`
+        """
+        raise NotImplementedError
+
+    def duration(self, seconds: float) -> float:
+        """How long waiting for story time takes in real time.
+
+        :param seconds: Story time.
+        :type seconds: :obj:`float`
+        :return: Real time in seconds.
+        :rtype: :obj:`float`
+        """
+        return seconds
+
+    def now(self) -> float:
+        """Current time of the clock.
+
+        :return: Time in seconds, only differences between values are meaningful.
+        :rtype: :obj:`float`
+        """
+        raise NotImplementedError
+
+
+class RealClock(Clock):
+    """Waits in real time, in an event loop without blocking it."""
+    async def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        if _loop_running():
+            from asyncio import sleep as wait  # Already imported by the running loop
+            await wait(seconds)
+        else:
+            sleep(seconds)
+
+    def now(self) -> float:
+        return monotonic()
+
+
+class ScaledClock(RealClock):
+    """Waits in real time multiplied by a factor.
+
+    :param factor: How much of story time to wait, e.g. ``0.1`` is ten times faster.
+    :type factor: :obj:`float`
+    """
+    def __init__(self, factor: float) -> None:
+        self.factor: float = factor
+
+    async def sleep(self, seconds: float) -> None:
+        await super().sleep(seconds * self.factor)
+
+    def duration(self, seconds: float) -> float:
+        return seconds * self.factor
+
+
+class VirtualClock(Clock):
+    """Doesn't wait, only advances its own time."""
+    def __init__(self) -> None:
+        self._now: float = 0.0
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._now += seconds
+
+    def duration(self, seconds: float) -> float:
+        return 0.0
+
+    def now(self) -> float:
+        return self._now
+
+
+def clock_from(setting: str) -> Clock:
+    """Creates a clock from its' textual representation.
+
+    :param setting: ``"real"``, ``"virtual"`` or a scale factor like ``"0.1"``.
+    :type setting: :obj:`str`
+    :return: Desired clock.
+    :rtype: :class:`FTE.pacing.Clock`
+    """
+    match setting.lower():
+        case 'real':
+            return RealClock()
+        case 'virtual':
+            return VirtualClock()
+        case factor:
+            return ScaledClock(float(factor))
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Parsing of player's commands. Commands and names can be abbreviated to any
+unambiguous prefix, e.g. ``g eng`` means ``go Engine Deck``.
+"""
+from typing import Any, Iterator
+
+from FTE.entities import fold
+
+
+class _Node:
+    """Single letter of a :class:`Trie`."""
+    __slots__ = ('children', 'value', 'terminal', 'count')
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.value: Any = None
+        self.terminal: bool = False
+        self.count: int = 0  # Keys ending in this node or below
+
+
+class Trie:
+    """Prefix tree of case-insensitive keys, e.g. names.
+
+    Finding a key by its' prefix takes time proportional to the key's length, no matter how many keys are stored.
+
+    :param items: Keys mapped to their values.
+    :type items: :obj:`dict`
+    """
+    def __init__(self, items: dict[str, Any] = None) -> None:
+        self._root: _Node = _Node()
+        for key, value in (items or {}).items():
+            self.insert(key, value)
+
+    def __len__(self) -> int:
+        return self._root.count
+
+    def __contains__(self, key: str) -> bool:
+        return (node := self._find(key)) is not None and node.terminal
+
+    def _find(self, prefix: str) -> _Node | None:
+        """Finds the node of a prefix.
+
+        :param prefix: The prefix.
+        :type prefix: :obj:`str`
+        :return: The node, `None` if no key starts with the prefix.
+        :rtype: :class:`FTE.parser._Node` or `None`
+        """
+        node = self._root
+        for char in fold(prefix):
+            if (node := node.children.get(char)) is None:
+                return None
+        return node
+
+    def insert(self, key: str, value: Any) -> None:
+        """Adds a key or replaces its' value.
+
+        :param key: The key.
+        :type key: :obj:`str`
+        :param value: The key's value.
+        """
+        folded = fold(key)
+        if (node := self._find(folded)) is not None and node.terminal:
+            node.value = value
+            return
+        node = self._root
+        node.count += 1
+        for char in folded:
+            if (child := node.children.get(char)) is None:
+                child = node.children[char] = _Node()
+            node = child
+            node.count += 1
+        node.value, node.terminal = value, True
+
+    def remove(self, key: str) -> None:
+        """Removes a key, if it exists.
+
+        :param key: The key.
+        :type key: :obj:`str`
+        """
+        if key not in self:
+            return
+        node = self._root
+        node.count -= 1
+        for char in fold(key):
+            child = node.children[char]
+            child.count -= 1
+            if child.count == 0:
+                del node.children[char]
+                return
+            node = child
+        node.value, node.terminal = None, False
+
+    def resolve(self, prefix: str) -> Any:
+        """Finds a value by its' key or an unambiguous prefix of the key.
+
+        :param prefix: The key or its' prefix.
+        :type prefix: :obj:`str`
+        :return: The value, `None` if there is no such key or the prefix is ambiguous.
+        """
+        if (node := self._find(prefix)) is None:
+            return None
+        if node.terminal:
+            return node.value
+        if node.count != 1:
+            return None
+        while not node.terminal:
+            node = next(iter(node.children.values()))
+        return node.value
+
+    def _values(self, node: _Node) -> Iterator[Any]:
+        """Iterates over values of a node and all nodes below.
+
+        :param node: The node.
+        :type node: :class:`FTE.parser._Node`
+        """
+        if node.terminal:
+            yield node.value
+        for child in node.children.values():
+            yield from self._values(child)
+
+    def complete(self, prefix: str, limit: int = None) -> list[Any]:
+        """Finds values of all keys starting with a prefix.
+
+        :param prefix: The prefix.
+        :type prefix: :obj:`str`
+        :param limit: Maximum number of values, defaults to all.
+        :type limit: :obj:`int`
+        :return: The values.
+        :rtype: :obj:`list`
+        """
+        if (node := self._find(prefix)) is None:
+            return []
+        values = []
+        for value in self._values(node):
+            if limit is not None and len(values) >= limit:
+                break
+            values.append(value)
+        return values
+
+
+def distance(a: str, b: str) -> int:
+    """Edit distance, how many letters must be inserted, removed, changed or swapped with a neighbour
+    to get one word from another (optimal string alignment).
+
+    :param a: First word.
+    :type a: :obj:`str`
+    :param b: Second word.
+    :type b: :obj:`str`
+    :return: The distance.
+    :rtype: :obj:`int`
+    """
+    before, previous = None, list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            d = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                d = min(d, before[j - 2] + 1)
+            current.append(d)
+        before, previous = previous, current
+    return previous[-1]
+
+
+class TypoIndex:
+    """Index of words by all their variants with a single letter removed.
+
+    Two words differing by a single typo (an inserted, removed, changed or swapped letter)
+    share such a variant, so similar words are found with a few :obj:`dict` lookups,
+    no matter how many words are stored.
+
+    Variants are stored as hashes, mapped to a word or a :obj:`tuple` of words,
+    hash collisions only add candidates, which are rejected by their distance.
+    """
+    def __init__(self) -> None:
+        self._variants: dict[int, str | tuple[str, ...]] = {}
+
+    @staticmethod
+    def _deletes(word: str) -> set[int]:
+        """Hashes of the word and all its' variants with a single letter removed.
+
+        :param word: The word.
+        :type word: :obj:`str`
+        :return: The variants' hashes.
+        :rtype: :obj:`set` of :obj:`int`
+        """
+        return {hash(word), *(hash(word[:i] + word[i + 1:]) for i in range(len(word)))}
+
+    def add(self, word: str) -> None:
+        """Adds a word.
+
+        :param word: The word.
+        :type word: :obj:`str`
+        """
+        for variant in self._deletes(word):
+            if (words := self._variants.get(variant)) is None:
+                self._variants[variant] = word
+            elif isinstance(words, str):
+                if words != word:
+                    self._variants[variant] = (words, word)
+            elif word not in words:
+                self._variants[variant] = (*words, word)
+
+    def discard(self, word: str) -> None:
+        """Removes a word, if it's stored.
+
+        :param word: The word.
+        :type word: :obj:`str`
+        """
+        for variant in self._deletes(word):
+            if (words := self._variants.get(variant)) is None:
+                continue
+            if isinstance(words, str):
+                if words == word:
+                    del self._variants[variant]
+            elif word in words:
+                rest = tuple(w for w in words if w != word)
+                self._variants[variant] = rest if len(rest) > 1 else rest[0]
+
+    def _candidates(self, word: str) -> set[str]:
+        """Stored words sharing a variant with a word.
+
+        :param word: The word.
+        :type word: :obj:`str`
+        :return: The words.
+        :rtype: :obj:`set` of :obj:`str`
+        """
+        candidates = set()
+        for variant in self._deletes(word):
+            if (words := self._variants.get(variant)) is None:
+                continue
+            if isinstance(words, str):
+                candidates.add(words)
+            else:
+                candidates.update(words)
+        return candidates
+
+    def search(self, word: str, tolerance: int) -> list[tuple[int, str]]:
+        """Finds stored words similar to a word.
+
+        :param word: The word.
+        :type word: :obj:`str`
+        :param tolerance: Maximum distance of found words.
+        :type tolerance: :obj:`int`
+        :return: Distances and found words.
+        :rtype: :obj:`list` of :obj:`tuple`
+        """
+        return [(d, stored) for stored in self._candidates(word) if (d := distance(word, stored)) <= tolerance]
+
+
+class Vocabulary:
+    """Words the player can use, e.g. known locations' names.
+
+    Words are found by their unambiguous prefixes (:class:`Trie`) or suggested
+    when misspelled (:class:`TypoIndex`). The typo index is built on the first suggestion,
+    most vocabularies (e.g. of a replayed chapter) never need one.
+
+    :param items: Words mapped to their values.
+    :type items: :obj:`dict`
+    """
+    def __init__(self, items: dict[str, Any] = None) -> None:
+        self._trie: Trie = Trie()
+        self._typos: TypoIndex | None = None  # Built by :meth:`suggest`
+        self._values: dict[str, Any] = {}  # Case-folded words mapped to values
+        for key, value in (items or {}).items():
+            self.insert(key, value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: str) -> bool:
+        return fold(key) in self._values
+
+    def insert(self, key: str, value: Any) -> None:
+        """Adds a word or replaces its' value.
+
+        :param key: The word.
+        :type key: :obj:`str`
+        :param value: The word's value.
+        """
+        self._trie.insert(key, value)
+        folded = fold(key)
+        if self._typos is not None:
+            self._typos.add(folded)
+        self._values[folded] = value
+
+    def remove(self, key: str) -> None:
+        """Removes a word, if it exists.
+
+        :param key: The word.
+        :type key: :obj:`str`
+        """
+        if self._values.pop(folded := fold(key), None) is None:
+            return
+        self._trie.remove(key)
+        if self._typos is not None:
+            self._typos.discard(folded)
+
+    def resolve(self, prefix: str) -> Any:
+        """See :meth:`Trie.resolve`."""
+        return self._trie.resolve(prefix)
+
+    def complete(self, prefix: str, limit: int = None) -> list[Any]:
+        """See :meth:`Trie.complete`."""
+        return self._trie.complete(prefix, limit)
+
+    def suggest(self, word: str, limit: int = 3) -> list[Any]:
+        """Finds values of words similar to a misspelled one, differing by a single typo.
+
+        :param word: The misspelled word.
+        :type word: :obj:`str`
+        :param limit: Maximum number of suggestions.
+        :type limit: :obj:`int`
+        :return: Values of the most similar words first.
+        :rtype: :obj:`list`
+        """
+        if self._typos is None:
+            self._typos = TypoIndex()
+            for key in self._values:
+                self._typos.add(key)
+        folded = fold(word)
+        found = sorted(self._typos.search(folded, 1))  # The index finds only words a single typo away
+        return [self._values[key] for _, key in found[:limit]]
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Headless replays of the game, driven by a transcript of the player's inputs.
+
+A replay runs without pacing, captures all output and every value returned
+by :meth:`FTE.world.World.interaction`, so story branches can be compared
+against recorded (golden) transcripts::
+
+    python -m FTE.replay inputs.txt --record capsules.json
+    python -m FTE.replay inputs.txt --golden capsules.json
+
+The inputs file contains one player's line per line.
+
+Replays play the real chapters, so every replay builds its' world and renders all
+output. A short playthrough of chapter one (6 lines) replays about 95 times per second
+with the rich console and about 1000 times per second with ``--console ansi``, on a
+single core, measured with::
+
+    python -m FTE.replay inputs.txt --repeat 1000 --console ansi
+
+Thousands of rendered replays per second on a single core are not reached yet, most of
+the time is assembling and rendering texts; building the world takes about 0.1 ms.
+Until then, use many processes, or :meth:`FTE.world.World.execute_many` on a shared
+world, which renders nothing.
+"""
+from argparse import ArgumentParser
+from difflib import unified_diff
+from io import StringIO
+from json import dump, load
+from sys import exit as sys_exit
+from time import perf_counter
+from typing import Callable, Coroutine
+
+from FTE.characters import Character
+from FTE.console import CONSOLES
+from FTE.locations import Location
+from FTE.pacing import VirtualClock
+from FTE.session import Session, run_blocking
+
+
+def _describe(result: Character | Location | None) -> str | None:
+    """Describes a value returned by an interaction, so it can be stored as JSON.
+
+    :param result: The value.
+    :type result: :class:`FTE.characters.Character`, :class:`FTE.locations.Location`, or `None`
+    :return: E.g. ``"Location: Capsules"``, `None` if nothing was returned.
+    :rtype: :obj:`str` or `None`
+    """
+    if result is None:
+        return None
+    return f'{type(result).__name__}: {result.name}'
+
+
+class ReplaySession(Session):
+    """Session without pacing, which reads input from a transcript and records interactions.
+
+    :param inputs: Player's lines.
+    :type inputs: :obj:`list` of :obj:`str`
+    :param width: Width of the console.
+    :type width: :obj:`int`
+    :param console: ``"rich"`` or ``"ansi"``, see :mod:`FTE.console`.
+    :type console: :obj:`str`
+    """
+    def __init__(self, inputs: list[str], width: int = 80, console: str = 'rich') -> None:
+        self.output = StringIO()
+        super().__init__(
+            CONSOLES[console](
+                file=self.output,
+                input_stream=StringIO(''.join(f'{line}\n' for line in inputs)),
+                width=width,
+                color_system=None,
+                highlight=False
+            ),
+            VirtualClock()
+        )
+        self.interactions: list[str | None] = []
+        self.turn_times: list[float] = []
+        self._turn_start: float = perf_counter()
+
+    def interacted(self, result) -> None:
+        now = perf_counter()
+        self.interactions.append(_describe(result))
+        self.turn_times.append(now - self._turn_start)
+        self._turn_start = now
+
+
+class Replay:
+    """Result of a replay.
+
+    :param inputs: Player's lines.
+    :type inputs: :obj:`list` of :obj:`str`
+    :param session: The session the replay was played in.
+    :type session: :class:`FTE.replay.ReplaySession`
+    :param ending: How the replay ended: ``"finished"``, ``"exited"`` or ``"exhausted"`` (inputs ran out).
+    :type ending: :obj:`str`
+    """
+    def __init__(self, inputs: list[str], session: ReplaySession, ending: str) -> None:
+        self.inputs: list[str] = inputs
+        self.output: str = session.output.getvalue()
+        self.interactions: list[str | None] = session.interactions
+        self.turn_times: list[float] = session.turn_times
+        self.story_time: float = session.clock.now()
+        self.ending: str = ending
+
+    def to_dict(self) -> dict:
+        """Golden transcript of the replay, without timings.
+
+        :return: JSON serializable transcript.
+        :rtype: :obj:`dict`
+        """
+        return dict(
+            inputs=self.inputs,
+            ending=self.ending,
+            interactions=self.interactions,
+            story_time=self.story_time,
+            output=self.output.splitlines()
+        )
+
+    def compare(self, golden: dict) -> list[str]:
+        """Compares the replay with a golden transcript.
+
+        :param golden: Transcript recorded by :meth:`to_dict`.
+        :type golden: :obj:`dict`
+        :return: Differences in unified diff format, empty if transcripts are the same.
+        :rtype: :obj:`list` of :obj:`str`
+        """
+        expected, actual = golden.copy(), self.to_dict()
+        expected_output, actual_output = expected.pop('output'), actual.pop('output')
+        differences = [
+            f'{key}: expected {expected.get(key)!r}, got {value!r}'
+            for key, value in actual.items()
+            if expected.get(key) != value
+        ]
+        differences.extend(unified_diff(expected_output, actual_output, 'golden', 'replay', lineterm=''))
+        return differences
+
+
+def replay(inputs: list[str], game: Callable[[], Coroutine] = None, width: int = 80, console: str = 'rich') -> Replay:
+    """Plays the game with a transcript of inputs.
+
+    :param inputs: Player's lines.
+    :param game: Coroutine function to play, defaults to :func:`FTE.chapters.chapter_one`.
+    :param game: What to play, defaults to :func:`FTE.chapters.chapter_one`.
+    :type game: :obj:`typing.Callable`
+    :param width: Width of the console.
+    :type width: :obj:`int`
+    :param console: ``"rich"`` or ``"ansi"``, see :mod:`FTE.console`.
+    :type console: :obj:`str`
+    :return: The replay's result.
+    :rtype: :class:`FTE.replay.Replay`
+    """
+    if game is None:
+        from FTE.chapters import chapter_one as game
+    with ReplaySession(inputs, width, console) as session:
+        try:
+            run_blocking(game())
+        except EOFError:
+            ending = 'exhausted'
+        except SystemExit:
+            ending = 'exited'
+        else:
+            ending = 'finished'
+    return Replay(inputs, session, ending)
+
+
+def main() -> None:
+    parser = ArgumentParser('python -m FTE.replay', description='Replays the game with a transcript of inputs.')
+    parser.add_argument('inputs', help='file with one player\'s line per line')
+    parser.add_argument('--game', action='store_true', help='start from the main menu instead of chapter one')
+    parser.add_argument('--record', metavar='GOLDEN', help='save the replay as a golden transcript')
+    parser.add_argument('--golden', metavar='GOLDEN', help='compare the replay with a golden transcript')
+    parser.add_argument('--repeat', type=int, default=1, help='play many times and report timings')
+    parser.add_argument('--console', choices=CONSOLES, default='rich', help='how output is rendered')
+    args = parser.parse_args()
+    with open(args.inputs, encoding='utf-8') as file:
+        inputs = file.read().splitlines()
+    if args.game:
+        from FTE.game import play as game
+    else:
+        from FTE.chapters import chapter_one as game
+    start = perf_counter()
+    for _ in range(args.repeat):
+        result = replay(inputs, game, console=args.console)
+    elapsed = perf_counter() - start
+    if args.repeat > 1:
+        turns = len(result.turn_times) or 1
+        print(
+            f'{args.repeat} replays in {elapsed:.3f} s'
+            f' ({args.repeat / elapsed:.0f}/s),'
+            f' {1e6 * sum(result.turn_times) / turns:.0f} µs per turn'
+        )
+    if args.record:
+        with open(args.record, 'w', encoding='utf-8') as file:
+            dump(result.to_dict(), file, indent=2, ensure_ascii=False)
+    if args.golden:
+        with open(args.golden, encoding='utf-8') as file:
+            differences = result.compare(load(file))
+        if differences:
+            print(*differences, sep='\n')
+            sys_exit(1)
+    if not (args.record or args.golden or args.repeat > 1):
+        print(result.output, end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+Results of player's commands, kept as plain data until they are displayed.
+"""
+from typing import TYPE_CHECKING
+
+from rich.style import Style
+from rich.text import Text
+
+from FTE.catalog import parse
+from FTE.console import GameConsole, render_cache
+from FTE.entities import Entity
+from FTE.events import Event
+from FTE.session import get_session
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+
+class Message:
+    """Something the world tells the player.
+
+    Entities are put into ``{}`` placeholders of the template, so the message can be
+    read as plain text or displayed with entities' colors. The colored message is
+    assembled once and reused, until an entity's :attr:`FTE.entities.Entity.display_name` changes.
+
+    :param template: The message, optionally with ``{}`` placeholders.
+    :type template: :obj:`str`
+    :param args: Values of the placeholders, e.g. characters or locations.
+    :param location: Location displayed before the message, `None` if nothing is displayed.
+    :type location: :class:`FTE.locations.Location` or `None`
+    :param end: Ending of the message, defaults to ``"\\n"``.
+    :type end: :obj:`str`
+    """
+    pause: float = 0.0  # Story time to wait after the message is displayed, see :meth:`Result.render`
+
+    def __init__(self, template: str, *args, location: Entity = None, end: str = '\n') -> None:
+        self.template: str = template
+        self.args: tuple = args
+        self.location: Entity | None = location
+        self.end: str = end
+        self._renderable: Text | None = None
+        self._pieces: tuple = ()  # Styled values of the placeholders, which :attr:`_renderable` was assembled from
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.text!r})'
+
+    @staticmethod
+    def _plain(value) -> str:
+        if isinstance(value, Entity):
+            return value.name if value.known else '???'
+        return str(value)
+
+    @staticmethod
+    def _styled(value) -> str | Text:
+        if isinstance(value, Entity):
+            return value.display_name
+        if hasattr(value, 'color_text'):
+            return value.color_text
+        return value
+
+    @property
+    def text(self) -> str:
+        """The message as plain text."""
+        if not self.args:
+            return self.template
+        parts = self.template.split('{}')
+        return ''.join(part + self._plain(arg) for part, arg in zip(parts, self.args)) + parts[-1]
+
+    @property
+    def renderable(self) -> Text:
+        """The message with entities' colors, shared by all its' renders, so it must not be modified."""
+        if not self.args:
+            return parse(self.template)
+        if (text := self._renderable) is not None:
+            for arg, piece in zip(self.args, self._pieces):
+                if self._styled(arg) is not piece:  # Entities' display names are replaced when they change
+                    break
+            else:
+                return text
+        self._pieces = pieces = tuple(self._styled(arg) for arg in self.args)
+        parts = self.template.split('{}')
+        self._renderable = text = Text.assemble(
+            *(piece for part, styled in zip(parts, pieces) for piece in (part, styled)),
+            parts[-1]
+        )
+        return text
+
+    def render(self, console: GameConsole) -> None:
+        """Displays the message.
+
+        :param console: Where to display.
+        :type console: :class:`FTE.console.GameConsole`
+        """
+        self._render_location(console)
+        console.print(self.renderable, end=self.end)
+
+    def _render_location(self, console: GameConsole) -> None:
+        """Displays the message's location, if it has any.
+
+        :param console: Where to display.
+        :type console: :class:`FTE.console.GameConsole`
+        """
+        if self.location is not None:
+            console.print(Text.assemble('[ ', self.location.display_name, ' ] '), end='')
+
+
+class Speech(Message):
+    """Something a character tells the player.
+
+    :param speaker: The character.
+    :type speaker: :class:`FTE.characters.Character`
+    """
+    pause: float = 1.5  # Like :meth:`FTE.characters.Character.monologue`
+
+    def __init__(self, speaker: Entity, template: str, *args) -> None:
+        super().__init__(template, *args)
+        self.speaker = speaker
+
+    def render(self, console: GameConsole) -> None:
+        console.print(self.speaker.quote(self.renderable))
+
+
+RETRY_STYLE: Style = Style(color='yellow', italic=True)
+
+
+class Retry(Message):
+    """Information the player's input was interrupted."""
+    def __init__(self) -> None:
+        super().__init__(' Retry...')
+
+    @property
+    def renderable(self) -> Text:
+        return Text(self.template, style=RETRY_STYLE)
+
+
+class HelpTable(Message):
+    """Table explaining commands or their arguments.
+
+    Tables are static, so they are rendered once and their output cached, see :class:`FTE.console.RenderCache`.
+
+    :param title: Title of the table.
+    :type title: :obj:`str`
+    :param columns: Names of the columns.
+    :type columns: :obj:`tuple` of :obj:`str`
+    :param rows: Contents of the table.
+    :type rows: :obj:`list` of :obj:`tuple` of :obj:`str`
+    :param show_lines: If rows are separated with lines.
+    :type show_lines: :obj:`bool`
+    """
+    def __init__(
+            self,
+            title: str,
+            columns: tuple[str],
+            rows: list[tuple[str]],
+            *,
+            show_lines: bool = False
+    ) -> None:
+        super().__init__(title)
+        self.columns: tuple[str] = columns
+        self.rows: list[tuple[str]] = rows
+        self.show_lines: bool = show_lines
+
+    @property
+    def renderable(self) -> 'Table':
+        from rich.table import Table  # Imported only when help is shown, it's slow to import
+        table = Table(title=self.template, show_lines=self.show_lines)
+        for column in self.columns:
+            table.add_column(column)
+        for row in self.rows:
+            table.add_row(*row)
+        return table
+
+    def render(self, console: GameConsole) -> None:
+        self._render_location(console)
+        render_cache.draw(
+            console,
+            (self.template, self.columns, tuple(self.rows), self.show_lines, self.end),
+            lambda: console.print(self.renderable, end=self.end)
+        )
+
+
+class Result:
+    """Result of a player's command.
+
+    :param query: What the player typed.
+    :type query: :obj:`str`
+    """
+    def __init__(self, query: str) -> None:
+        self.query: str = query
+        self.command = None
+        self.argument: str | None = None
+        self.target = None
+        self.messages: list[Message] = []
+        self.events: list[Event] = []
+        self.exit: bool = False
+
+    def __repr__(self) -> str:
+        return f'Result({self.query!r}, target={self.target!r}, events={self.events!r})'
+
+    @property
+    def text(self) -> str:
+        """All messages as plain text."""
+        return ''.join(message.text + message.end for message in self.messages)
+
+    async def render(self, console: GameConsole) -> None:
+        """Displays all messages, pausing after the ones which ask for it, e.g. :class:`Speech`.
+
+        :param console: Where to display.
+        :type console: :class:`FTE.console.GameConsole`
+        """
+        for message in self.messages:
+            message.render(console)
+            if message.pause:
+                await get_session().pause(message.pause)
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+Game server, hosts many players in a single process over raw TCP (e.g. ``telnet``).
+
+Connections are handled by :mod:`asyncio` and every player's :class:`FTE.session.Session`
+is played as a coroutine on the same event loop, in a single thread. Waiting for
+the player's input (:class:`ConnectionInput`) and pacing pauses (:mod:`FTE.pacing`)
+are awaited, so the loop plays other games meanwhile. Players connecting when all
+seats (``max_sessions``) are taken are told so and disconnected right away.
+
+Run the server::
+
+    python -m FTE.server --port 2323
+
+Load test a running server with scripted clients, it reports how many games
+were played at the same time and how many players were turned away::
+
+    python -m FTE.server --port 2323 --load-test 1000
+"""
+from argparse import ArgumentParser
+from asyncio import StreamReader, StreamWriter, gather, open_connection, run, start_server
+from time import perf_counter
+
+from FTE.catalog import catalog
+from FTE.console import CONSOLES
+from FTE.game import play
+from FTE.pacing import clock_from
+from FTE.session import Session
+from FTE.settings import CONSOLE, PACING
+
+
+IAC, SB, SE = 255, 250, 240  # Telnet commands, which are skipped in the input
+BACKLOG: int = 4096  # Connections waiting to be accepted, also ones which will be turned away
+
+
+def _strip_telnet(data: bytes) -> bytes:
+    """Removes telnet negotiation from received data.
+
+    :param data: Received data.
+    :type data: :obj:`bytes`
+    :return: Data typed by the player.
+    :rtype: :obj:`bytes`
+    """
+    if IAC not in data:
+        return data
+    result, i = bytearray(), 0
+    while i < len(data):
+        if data[i] != IAC:
+            result.append(data[i])
+            i += 1
+        elif i + 1 < len(data) and data[i + 1] == SB:
+            end = data.find(bytes((IAC, SE)), i + 2)
+            i = len(data) if end == -1 else end + 2
+        else:
+            i += 3 if i + 1 < len(data) and data[i + 1] != IAC else 2
+    return bytes(result)
+
+
+class ConnectionInput:
+    """Player's input, read from the connection by the session's coroutine.
+
+    :param reader: The connection's reader.
+    :type reader: :class:`asyncio.StreamReader`
+    """
+    def __init__(self, reader: StreamReader) -> None:
+        self._reader: StreamReader = reader
+
+    async def readline(self) -> str:
+        """Waits for a line typed by the player, the event loop plays other games meanwhile.
+
+        :return: The line, ``""`` if the player has disconnected.
+        :rtype: :obj:`str`
+        """
+        try:
+            data = await self._reader.readline()
+        except (ConnectionError, ValueError):  # Reset, or a line longer than the reader's limit
+            return ''
+        return _strip_telnet(data).decode(errors='ignore')
+
+
+class ConnectionOutput:
+    """Game output, written to the connection by the session's coroutine.
+
+    :param writer: The connection's writer.
+    :type writer: :class:`asyncio.StreamWriter`
+    """
+    def __init__(self, writer: StreamWriter) -> None:
+        self._writer: StreamWriter = writer
+
+    def write(self, text: str) -> int:
+        if not self._writer.is_closing():
+            self._writer.write(text.replace('\n', '\r\n').encode())
+        return len(text)
+
+    def flush(self) -> None:
+        """Does nothing, data is sent by the event loop."""
+
+    def isatty(self) -> bool:
+        return True
+
+
+class GameServer:
+    """Accepts connections and plays a separate game for each of them.
+
+    :param host: Address to listen on.
+    :type host: :obj:`str`
+    :param port: Port to listen on.
+    :type port: :obj:`int`
+    :param max_sessions: How many games can be played at the same time, other players are turned away.
+    :type max_sessions: :obj:`int`
+    :param pacing: Pacing of all games, see :func:`FTE.pacing.clock_from`.
+    :type pacing: :obj:`str`
+    :param console: Console of all games, ``"rich"`` or ``"ansi"``, see :mod:`FTE.console`.
+    :type console: :obj:`str`
+    :param reuse_port: If other processes can listen on the same port.
+    :type reuse_port: :obj:`bool`
+    """
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 2323,
+            *,
+            max_sessions: int = 4096,
+            pacing: str = PACING,
+            console: str = CONSOLE,
+            reuse_port: bool = False
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.max_sessions: int = max_sessions
+        self.pacing: str = pacing
+        self.console: str = console
+        self.reuse_port: bool = reuse_port
+        self.sessions: int = 0
+        self.peak_sessions: int = 0  # Most games played at the same time
+        self.rejected: int = 0  # Players turned away, because all seats were taken
+
+    async def _handle(self, reader: StreamReader, writer: StreamWriter) -> None:
+        """Plays a game for a single connection.
+
+        :param reader: The connection's reader.
+        :type reader: :class:`asyncio.StreamReader`
+        :param writer: The connection's writer.
+        :type writer: :class:`asyncio.StreamWriter`
+        """
+        if self.sessions >= self.max_sessions:
+            self.rejected += 1
+            writer.write(catalog['server.full'].encode() + b'\r\n')
+            writer.close()
+            return
+        session = Session(
+            CONSOLES[self.console](
+                file=ConnectionOutput(writer),
+                input_stream=ConnectionInput(reader),
+                buffered=True,
+                force_terminal=True,
+                color_system='standard',
+                width=80,
+                height=24,
+                highlight=False
+            ),
+            clock_from(self.pacing)
+        )
+        self.sessions += 1
+        self.peak_sessions = max(self.peak_sessions, self.sessions)
+        try:
+            with session:
+                await play()
+        except (EOFError, SystemExit):
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def serve_forever(self) -> None:
+        """Listens for connections until cancelled."""
+        server = await start_server(
+            self._handle,
+            self.host,
+            self.port,
+            backlog=max(BACKLOG, self.max_sessions),
+            reuse_port=self.reuse_port or None
+        )
+        async with server:
+            await server.serve_forever()
+
+
+async def scripted_client(host: str, port: int, lines: list[str]) -> tuple[float, float] | None:
+    """Plays a game by sending prepared lines, one after each received prompt.
+
+    :param host: Server's address.
+    :type host: :obj:`str`
+    :param port: Server's port.
+    :type port: :obj:`int`
+    :param lines: What the player types, sent once the game starts.
+    :type lines: :obj:`list` of :obj:`str`
+    :return: When the game started (first output received) and ended, `None` if the server was full.
+    :rtype: :obj:`tuple` of :obj:`float` or `None`
+    """
+    reader, writer = await open_connection(host, port)
+    first = await reader.read(4096)  # The game speaks first, a full server too
+    start = perf_counter()
+    if first.startswith(catalog['server.full'].encode()):
+        writer.close()
+        return None
+    for line in lines:
+        writer.write(line.encode() + b'\r\n')
+    await writer.drain()
+    while await reader.read(4096):
+        pass
+    writer.close()
+    return start, perf_counter()
+
+
+def peak_concurrency(games: list[tuple[float, float]]) -> int:
+    """Most games played at the same time.
+
+    :param games: When each game started and ended.
+    :type games: :obj:`list` of :obj:`tuple`
+    :return: The number of games.
+    :rtype: :obj:`int`
+    """
+    peak = current = 0
+    for _, change in sorted([(start, 1) for start, _ in games] + [(end, -1) for _, end in games]):
+        current += change
+        peak = max(peak, current)
+    return peak
+
+
+async def load_test(host: str, port: int, clients: int) -> None:
+    """Connects many scripted clients at once and prints their timings.
+
+    :param host: Server's address.
+    :type host: :obj:`str`
+    :param port: Server's port.
+    :type port: :obj:`int`
+    :param clients: How many players connect.
+    :type clients: :obj:`int`
+    """
+    lines = ['1', 'no', 'no', 'help', 'info', 'go Engine Deck']
+    start = perf_counter()
+    results = await gather(*(scripted_client(host, port, lines) for _ in range(clients)))
+    total = perf_counter() - start
+    games = [game for game in results if game is not None]
+    times = sorted(end - begin for begin, end in games) or [0.0]
+    print(
+        f'{clients} clients in {total:.2f} s: {len(games)} served, {clients - len(games)} turned away,'
+        f' at most {peak_concurrency(games)} at the same time,'
+        f' median {times[len(times) // 2]:.3f} s,'
+        f' slowest {times[-1]:.3f} s'
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser('python -m FTE.server', description='Hosts Fix The Engines for many players.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=2323)
+    parser.add_argument('--max-sessions', type=int, default=4096)
+    parser.add_argument('--pacing', default=PACING, help='"real", "virtual" or a scale factor')
+    parser.add_argument('--console', choices=CONSOLES, default=CONSOLE, help='how output is rendered')
+    parser.add_argument('--load-test', type=int, metavar='CLIENTS', help='connect scripted clients to a running server')
+    args = parser.parse_args()
+    if args.load_test:
+        run(load_test(args.host, args.port, args.load_test))
+        return
+    server = GameServer(
+        args.host,
+        args.port,
+        max_sessions=args.max_sessions,
+        pacing=args.pacing,
+        console=args.console
+    )
+    try:
+        run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Session is a single game played by a single player. It provides the console
+(input and output) and the clock used for pacing.
+
+Everything displayed by the game goes through the current session, so one
+process can run many isolated games, each activated in its own context.
+
+The game is a coroutine, waiting for input and pacing pauses are awaited. Many
+sessions are played by an event loop (see :mod:`FTE.server`), a single one
+can be played without any loop::
+
+    with Session(GameConsole(file=StringIO(), input_stream=StringIO('1\\n'))):
+        run_blocking(main_menu())
+"""
+from contextvars import ContextVar, Token
+from inspect import iscoroutinefunction
+from typing import Any, Coroutine
+
+from rich.text import Text
+
+from FTE.console import GameConsole, console
+from FTE.pacing import Clock, clock_from
+from FTE.settings import PACING
+
+
+class Session:
+    """Represents a game played on a console.
+
+    :param console: Where the game is displayed and input read from, defaults to a new standard console.
+    :type console: :class:`FTE.console.GameConsole`
+    :param clock: Clock used for pacing, defaults to ``PACING`` setting.
+    :type clock: :class:`FTE.pacing.Clock`
+    """
+    def __init__(
+            self,
+            console: GameConsole = None,
+            clock: Clock = None
+    ) -> None:
+        self.console: GameConsole = console or GameConsole(highlight=False)
+        self.clock: Clock = clock or clock_from(PACING)
+        self._tokens: list[Token] = []
+
+    def __enter__(self) -> 'Session':
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.console.flush()
+        _current.reset(self._tokens.pop())
+
+    def interacted(self, result) -> None:
+        """Called after every :meth:`FTE.world.World.interaction`, does nothing by default.
+
+        :param result: What the interaction returned.
+        :type result: :class:`FTE.characters.Character`, :class:`FTE.locations.Location`, or `None`
+        """
+
+    async def pause(self, seconds: float) -> None:
+        """Waits between displayed texts, according to the session's clock.
+        Buffered output is written first, so the player reads it while waiting.
+
+        :param seconds: Story time to wait.
+        :type seconds: :obj:`float`
+        """
+        if self.clock.duration(seconds) > 0:
+            self.console.flush()
+        await self.clock.sleep(seconds)
+
+    async def input(self, prompt: str | Text = '') -> str:
+        """Displays the prompt, writes buffered output and reads the player's line, see :meth:`FTE.console.GameConsole.input`.
+
+        Input streams with a coroutine ``readline`` (e.g. :class:`FTE.server.ConnectionInput`) are awaited,
+        others (e.g. standard input) are read by the console.
+
+        :param prompt: Displayed before the player's line.
+        :type prompt: :obj:`str` or :class:`rich.text.Text`
+        :return: The line, without its' ending.
+        :rtype: :obj:`str`
+        :raises EOFError: If the input has ended.
+        """
+        console = self.console
+        if not iscoroutinefunction(getattr(console.input_stream, 'readline', None)):
+            return console.input(prompt)
+        if prompt:
+            console.print(prompt, end='')
+        console.flush()
+        if not (line := await console.input_stream.readline()):
+            raise EOFError
+        return line.rstrip('\r\n')
+
+
+_current: ContextVar[Session] = ContextVar('session', default=Session(console))
+
+
+def get_session() -> Session:
+    """Session active in the current context, the standard terminal session by default.
+
+    :return: Current session.
+    :rtype: :class:`FTE.session.Session`
+    """
+    return _current.get()
+
+
+def run_blocking(coroutine: Coroutine) -> Any:
+    """Runs a part of the game without an event loop, e.g. the terminal game or a replay.
+
+    Sessions without a loop never suspend: their clocks sleep and their input is read directly.
+
+    :param coroutine: The game or any of its' parts, e.g. ``main_menu()``.
+    :type coroutine: :obj:`typing.Coroutine`
+    :return: What the coroutine returned.
+    :raises RuntimeError: If the coroutine awaited something, which needs an event loop.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError('The game awaited an event loop, run it with asyncio.run() instead.')
@@ -5,8 +5,21 @@ Game global settings.
 Settings are set by environemnt variables. None is required.
 
 `DEBUG` -- used for skipping game to current working point.
+
+`PACING` -- how long the game waits between texts: ``real``, ``virtual`` (no waiting)
+or a scale factor like ``0.1``. Defaults to ``virtual`` in debug mode, ``real`` otherwise.
+
+`BUFFERED` -- if output is collected and written once per turn, defaults to ``1``.
+
+`CONSOLE` -- how output is rendered: ``rich`` or ``ansi`` (lightweight, for pipes and bots), defaults to ``rich``.
+
+`GAME_LANGUAGE` -- language of the game's texts, defaults to ``en``.
 """
 from os import getenv
 
 
 DEBUG: bool = bool(int(getenv('DEBUG', 0)))
+PACING: str = getenv('PACING', 'virtual' if DEBUG else 'real')
+BUFFERED: bool = bool(int(getenv('BUFFERED', 1)))
+LANGUAGE: str = getenv('GAME_LANGUAGE', 'en')
+CONSOLE: str = getenv('CONSOLE', 'rich')
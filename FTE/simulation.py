@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+Ambient simulation of many NPCs, e.g. crew walking around the ship, advanced in vectorized ticks.
+
+Requires NumPy, an optional dependency::
+
+    pip install numpy
+
+State of simulated characters is kept in arrays (one row per character) beside
+:class:`FTE.characters.Character` objects: location IDs, standing values and
+schedules. A schedule is a route of locations, the character moves to the next
+location of its' route every ``period`` ticks. When a character moves, its'
+numeric standing (see :class:`FTE.standings.Standings`) shifts one point towards its' target standing.
+
+:meth:`Simulation.tick` only updates the arrays and logs which rows changed.
+Characters are synced back lazily, when the player observes them:
+:meth:`FTE.world.World.execute` calls :meth:`Simulation.observe` for the player's
+location, which checks only rows changed since the location was last observed.
+Ambient characters added by :meth:`Simulation.spawn` exist only as rows, until
+the player meets them. Moves of simulated characters made by the world, e.g. by
+:meth:`FTE.world.World.character_enters`, are written back to the arrays::
+
+    simulation = Simulation(world)
+    simulation.spawn('Crewman', routes, periods=30)
+    simulation.tick()
+"""
+import numpy as np
+
+from FTE.characters import Character, Standing
+from FTE.locations import Location
+from FTE.standings import LIMIT
+
+
+ROUTE_LENGTH: int = 8  # Maximum number of locations in a schedule's route
+NEVER: int = -1  # Next move tick of characters without schedule
+NOWHERE: int = -1  # Synced location of characters without objects
+
+
+class Simulation:
+    """Vectorized NPC simulation of a world.
+
+    :param world: The simulated world, it observes the simulation on every player's command.
+    :type world: :class:`FTE.world.World`
+    """
+    def __init__(self, world) -> None:
+        self.world = world
+        self.ticks: int = 0
+        self._locations: list[Location] = []
+        self._location_ids: dict[Location, int] = {}
+        for location in world._all_locations:
+            self.location_id(location)
+        self._characters: list[Character | None] = []  # `None` until an ambient character is observed
+        self._rows: dict[Character, int] = {}
+        self._names: list[tuple[str, int]] = []  # Names of spawned characters: prefix and first row
+        self.location = np.empty(0, np.int32)
+        self.standing = np.empty(0, np.int8)
+        self._target = np.empty(0, np.int8)
+        self._route = np.empty((0, ROUTE_LENGTH), np.int32)
+        self._route_length = np.empty(0, np.int8)
+        self._step = np.empty(0, np.int8)
+        self._period = np.empty(0, np.int32)
+        self._next_move = np.empty(0, np.int64)
+        self._synced_location = np.empty(0, np.int32)  # What characters' objects know, or `NOWHERE`
+        self._synced_standing = np.empty(0, np.int8)
+        self._log: list[np.ndarray] = []  # Rows changed by ticks and spawns, oldest first
+        self._log_start: int = 0  # Number of log entries dropped so far
+        self._logged: int = 0  # Number of rows in the log
+        self._seen: dict[int, int] = {}  # Location IDs mapped to the log entry their last observation reached
+        world.simulation = self
+
+    def __len__(self) -> int:
+        return len(self.location)
+
+    def location_id(self, location: Location) -> int:
+        """ID of a location, used in routes. Locations added to the world later get their IDs on first use.
+
+        :param location: The location.
+        :type location: :class:`FTE.locations.Location`
+        :return: The location's ID.
+        :rtype: :obj:`int`
+        """
+        if (location_id := self._location_ids.get(location)) is None:
+            location_id = self._location_ids[location] = len(self._locations)
+            self._locations.append(location)
+        return location_id
+
+    def _log_changed(self, rows: np.ndarray) -> None:
+        """Logs rows, which may differ from their characters' objects now.
+        When the log grows larger than the simulation, it's dropped, and locations are observed by a full scan.
+
+        :param rows: The rows.
+        :type rows: :class:`numpy.ndarray`
+        """
+        self._log.append(rows)
+        self._logged += len(rows)
+        if self._logged > len(self):
+            self._log_start += len(self._log)
+            self._log.clear()
+            self._logged = 0
+
+    def _append(
+            self,
+            routes: np.ndarray,
+            periods: np.ndarray | int,
+            phases: np.ndarray | int,
+            standings: np.ndarray | int,
+            targets: np.ndarray | int,
+            synced: bool
+    ) -> range:
+        """Adds rows of characters.
+
+        :param routes: Location IDs of each character's route, one row per character.
+        :type routes: :class:`numpy.ndarray`
+        :param periods: Ticks between moves, ``0`` if characters don't move.
+        :param phases: Ticks until the first move.
+        :param standings: Standing values, limited by :data:`FTE.standings.LIMIT`.
+        :param targets: Target standing values, limited by :data:`FTE.standings.LIMIT`.
+        :param synced: Whether characters' objects exist and are up to date.
+        :return: The new rows.
+        :rtype: :obj:`range`
+        """
+        count, length = routes.shape
+        if not 0 < length <= ROUTE_LENGTH:
+            raise ValueError(f'Routes must have 1 to {ROUTE_LENGTH} locations.')
+        start = len(self)
+        route = np.full((count, ROUTE_LENGTH), NOWHERE, np.int32)
+        route[:, :length] = routes
+        period = np.broadcast_to(np.asarray(periods, np.int32), count)
+        next_move = np.where(period > 0, self.ticks + np.asarray(phases, np.int64) + period, NEVER)
+        self.location = np.concatenate((self.location, route[:, 0]))
+        standings, targets = (np.clip(values, -LIMIT, LIMIT).astype(np.int8) for values in (standings, targets))
+        self.standing = np.concatenate((self.standing, np.broadcast_to(standings, count)))
+        self._target = np.concatenate((self._target, np.broadcast_to(targets, count)))
+        self._route = np.concatenate((self._route, route))
+        self._route_length = np.concatenate((self._route_length, np.full(count, length, np.int8)))
+        self._step = np.concatenate((self._step, np.zeros(count, np.int8)))
+        self._period = np.concatenate((self._period, period))
+        self._next_move = np.concatenate((self._next_move, np.broadcast_to(next_move, count)))
+        synced_location = route[:, 0] if synced else np.full(count, NOWHERE, np.int32)
+        self._synced_location = np.concatenate((self._synced_location, synced_location))
+        self._synced_standing = np.concatenate((self._synced_standing, self.standing[start:]))
+        return range(start, start + count)
+
+    def track(
+            self,
+            character: Character,
+            route: list[Location] = None,
+            period: int = 0,
+            *,
+            phase: int = 0,
+            target: int = None
+    ) -> None:
+        """Simulates an existing character.
+
+        :param character: The character, it must belong to the world.
+        :type character: :class:`FTE.characters.Character`
+        :param route: Where the character walks, defaults to staying in its' location.
+        :type route: :obj:`list` of :class:`FTE.locations.Location`
+        :param period: Ticks between moves, ``0`` if the character doesn't move.
+        :type period: :obj:`int`
+        :param phase: Ticks until the first move.
+        :type phase: :obj:`int`
+        :param target: Numeric standing the character's standing shifts to, defaults to its' current value.
+        :type target: :obj:`int`
+        """
+        route = route or [character.location]
+        if route[0] != character.location:
+            route = [character.location, *route]
+        row, = self._append(
+            np.array([[self.location_id(l) for l in route]], np.int32),
+            period,
+            phase,
+            value := self.world.standings.value(character),
+            value if target is None else int(target),
+            True
+        )
+        self._characters.append(character)
+        self._rows[character] = row
+
+    def spawn(
+            self,
+            name: str,
+            routes: np.ndarray,
+            periods: np.ndarray | int = 0,
+            *,
+            phases: np.ndarray | int = 0,
+            standings: np.ndarray | int = 0,
+            targets: np.ndarray | int = 0
+    ) -> range:
+        """Adds ambient characters, which exist only in the simulation until the player observes them.
+
+        :param name: Characters are named by it and their row, e.g. ``"Crewman 42"``.
+        :type name: :obj:`str`
+        :param routes: Location IDs (see :meth:`location_id`) of each character's route, one row per character.
+            Characters start in the first location of their route.
+        :type routes: :class:`numpy.ndarray`
+        :param periods: Ticks between moves, ``0`` if characters don't move.
+        :type periods: :class:`numpy.ndarray` or :obj:`int`
+        :param phases: Ticks until the first move, e.g. random, so characters don't move at once.
+        :type phases: :class:`numpy.ndarray` or :obj:`int`
+        :param standings: Numeric standings.
+        :type standings: :class:`numpy.ndarray` or :obj:`int`
+        :param targets: Numeric standings, which the characters' standings shift to.
+        :type targets: :class:`numpy.ndarray` or :obj:`int`
+        :return: Rows of the characters.
+        :rtype: :obj:`range`
+        """
+        rows = self._append(np.atleast_2d(np.asarray(routes, np.int32)), periods, phases, standings, targets, False)
+        self._characters.extend([None] * len(rows))
+        self._names.append((name, rows.start))
+        self._log_changed(np.arange(rows.start, rows.stop))
+        return rows
+
+    def tick(self) -> None:
+        """Advances all characters by a single tick, characters' objects are not updated."""
+        self.ticks += 1
+        if not (movers := np.flatnonzero(self._next_move == self.ticks)).size:
+            return
+        step = (self._step[movers] + 1) % self._route_length[movers]
+        self._step[movers] = step
+        self.location[movers] = self._route[movers, step]
+        self._next_move[movers] += self._period[movers]
+        standing = self.standing[movers].astype(np.int16)  # Differences of int8 values overflow int8
+        self.standing[movers] = np.clip(standing + np.sign(self._target[movers] - standing), -LIMIT, LIMIT)
+        self._log_changed(movers)
+
+    def _name(self, row: int) -> str:
+        """Name of an ambient character.
+
+        :param row: The character's row.
+        :type row: :obj:`int`
+        :return: The name.
+        :rtype: :obj:`str`
+        """
+        name = next(name for name, start in reversed(self._names) if start <= row)
+        return f'{name} {row}'
+
+    def _sync(self, row: int) -> Character:
+        """Updates a character's object, or creates it for an ambient character.
+        Changes of the character's standing made by the world since the last sync are kept.
+
+        :param row: The character's row.
+        :type row: :obj:`int`
+        :return: The character.
+        :rtype: :class:`FTE.characters.Character`
+        """
+        location, value, standings = self._locations[self.location[row]], int(self.standing[row]), self.world.standings
+        if (character := self._characters[row]) is None:
+            character = self._characters[row] = Character(self._name(row), location, standing=Standing.of(value))
+            self._rows[character] = row
+            self.world.add_character(character)
+        else:
+            if character.location != location:
+                character.location = location
+            value += standings.value(character) - int(self._synced_standing[row])  # Changed by the world meanwhile
+        standings.set(character, value)
+        self.standing[row] = self._synced_standing[row] = standings.value(character)
+        self._synced_location[row] = self.location[row]
+        return character
+
+    def sync(self, character: Character) -> None:
+        """Updates a simulated character's object, e.g. before the player reads about them.
+
+        :param character: The character, nothing happens if it's not simulated.
+        :type character: :class:`FTE.characters.Character`
+        """
+        if (row := self._rows.get(character)) is not None:
+            self._sync(row)
+
+    def moved(self, character: Character) -> None:
+        """Writes a simulated character's move made by the world back to the arrays,
+        called by :class:`FTE.world.World`. The character continues its' route from there.
+
+        :param character: The character which moved, nothing happens if it's not simulated.
+        :type character: :class:`FTE.characters.Character`
+        """
+        if (row := self._rows.get(character)) is not None:
+            self.location[row] = self._synced_location[row] = self.location_id(character.location)
+            self._log_changed(np.array([row]))  # Its' standing may still differ
+
+    def observe(self, location: Location = None) -> None:
+        """Updates objects of characters, who entered or left a location or changed standing since they were synced.
+        Ambient characters in the location get their objects. Only rows logged since the location's
+        last observation are checked.
+
+        :param location: The location, defaults to the player's location.
+        :type location: :class:`FTE.locations.Location`
+        """
+        if (location_id := self._location_ids.get(location or self.world._location)) is None:
+            return
+        seen, end = self._seen.get(location_id, 0), self._log_start + len(self._log)
+        if seen == end:
+            return
+        self._seen[location_id] = end
+        if seen < self._log_start:  # The log was dropped since
+            rows = np.flatnonzero((self.location == location_id) | (self._synced_location == location_id))
+        else:
+            rows = np.unique(np.concatenate(self._log[seen - self._log_start:]))
+            rows = rows[(self.location[rows] == location_id) | (self._synced_location[rows] == location_id)]
+        changed = (
+            (self.location[rows] != self._synced_location[rows]) | (self.standing[rows] != self._synced_standing[rows])
+        )
+        for row in rows[changed].tolist():
+            self._sync(row)
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Numeric standings of characters towards the player, changed one by one or for whole groups at once::
+
+    world.standings.shift_group('bridge crew', -5)  # The whole bridge crew now dislikes you
+    world.standings.mean(engine_deck)  # Average standing on the Engine Deck
+
+Values are stored in a contiguous :class:`array.array`, a character's :class:`FTE.characters.Standing`
+is derived from its' value (see :meth:`FTE.characters.Standing.of`). Groups are factions, which
+characters join and leave, and locations, which characters are in. Sums of groups' values are kept
+up to date on every change, so aggregates of a group take constant time.
+"""
+from array import array
+from typing import Hashable, Iterable
+
+from FTE.characters import Character, Standing
+from FTE.events import EventBus, EventType
+from FTE.locations import Location
+
+
+LIMIT: int = 100  # Values are kept between -LIMIT and LIMIT
+
+
+class Standings:
+    """Standings of all characters of a world.
+
+    :param occupants: Locations mapped to characters in them, kept up to date by the world.
+    :type occupants: :obj:`dict`
+    :param events: Where to post :attr:`FTE.events.EventType.STANDING_CHANGED` events,
+        when a character's :class:`FTE.characters.Standing` changes.
+    :type events: :class:`FTE.events.EventBus`
+    """
+    def __init__(
+            self,
+            occupants: dict[Location, dict[Character, None]] = None,
+            events: EventBus = None
+    ) -> None:
+        self._values: array = array('b')
+        self._characters: list[Character] = []
+        self._factions_of: list[tuple[Hashable, ...]] = []  # Factions of characters, by their slots
+        self._factions: dict[Hashable, dict[Character, None]] = {}
+        self._occupants: dict[Location, dict[Character, None]] = {} if occupants is None else occupants
+        self._sums: dict[Hashable, int] = {}
+        self._events: EventBus = EventBus() if events is None else events
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, character: Character) -> None:
+        """Starts keeping standing of a character, its' current standing is the initial value.
+        Sums of its' location are updated by :meth:`moved`.
+
+        :param character: The character.
+        :type character: :class:`FTE.characters.Character`
+        """
+        character._slot = len(self._values)
+        self._values.append(int(character.standing))
+        self._characters.append(character)
+        self._factions_of.append(())
+
+    def value(self, character: Character) -> int:
+        """Numeric standing of a character.
+
+        :param character: The character.
+        :type character: :class:`FTE.characters.Character`
+        :return: The value.
+        :rtype: :obj:`int`
+        """
+        return self._values[character._slot]
+
+    def _apply(self, slot: int, delta: int) -> None:
+        """Changes a character's value, sums of its' groups and its' standing, if it crossed a threshold.
+
+        :param slot: The character's slot.
+        :type slot: :obj:`int`
+        :param delta: How much to add, the value is limited by :data:`LIMIT`.
+        :type delta: :obj:`int`
+        """
+        old = self._values[slot]
+        if not (delta := max(-LIMIT, min(LIMIT, old + delta)) - old):
+            return
+        self._values[slot] = value = old + delta
+        character, sums = self._characters[slot], self._sums
+        sums[character.location] += delta
+        for faction in self._factions_of[slot]:
+            sums[faction] += delta
+        if (standing := Standing.of(value)) is not character._standing:
+            character._standing = standing
+            character._changed()
+            self._events.post(EventType.STANDING_CHANGED, character)
+
+    def set(self, character: Character, value: int) -> None:
+        """Sets numeric standing of a character.
+
+        :param character: The character.
+        :type character: :class:`FTE.characters.Character`
+        :param value: The value, limited by :data:`LIMIT`.
+        :type value: :obj:`int`
+        """
+        self._apply(character._slot, value - self._values[character._slot])
+
+    def shift(self, character: Character, delta: int) -> None:
+        """Changes numeric standing of a character.
+
+        :param character: The character.
+        :type character: :class:`FTE.characters.Character`
+        :param delta: How much to add, negative if the character likes the player less.
+        :type delta: :obj:`int`
+        """
+        self._apply(character._slot, delta)
+
+    def shift_many(self, characters: Iterable[Character], delta: int) -> None:
+        """Changes numeric standings of many characters.
+
+        :param characters: The characters.
+        :type characters: :obj:`typing.Iterable` of :class:`FTE.characters.Character`
+        :param delta: How much to add to each character's value.
+        :type delta: :obj:`int`
+        """
+        values, factions_of, sums = self._values, self._factions_of, self._sums
+        listens = self._events.listens(EventType.STANDING_CHANGED)
+        good, bad, neutral = Standing.GOOD, Standing.BAD, Standing.NEUTRAL
+        for character in characters:  # :meth:`_apply` inlined, it's called for thousands of characters
+            slot = character._slot
+            old = values[slot]
+            if not (change := max(-LIMIT, min(LIMIT, old + delta)) - old):
+                continue
+            values[slot] = value = old + change
+            sums[character.location] += change
+            for faction in factions_of[slot]:
+                sums[faction] += change
+            standing = good if value >= good else bad if value <= bad else neutral
+            if standing is not character._standing:
+                character._standing = standing
+                character._changed()
+                if listens:
+                    self._events.post(EventType.STANDING_CHANGED, character)
+
+    def shift_group(self, group: Hashable, delta: int) -> None:
+        """Changes numeric standings of all members of a group.
+
+        :param group: A faction or a location.
+        :type group: :obj:`typing.Hashable`
+        :param delta: How much to add to each member's value.
+        :type delta: :obj:`int`
+        """
+        self.shift_many(tuple(self.members(group)), delta)
+
+    def members(self, group: Hashable) -> Iterable[Character]:
+        """Characters in a group.
+
+        :param group: A faction or a location.
+        :type group: :obj:`typing.Hashable`
+        :return: The characters.
+        :rtype: :obj:`typing.Iterable` of :class:`FTE.characters.Character`
+        """
+        if isinstance(group, Location):
+            return self._occupants.get(group, {}).keys()
+        return self._factions.get(group, {}).keys()
+
+    def join(self, character: Character, faction: Hashable) -> None:
+        """Adds a character to a faction, if it isn't its' member yet.
+
+        :param character: The character.
+        :type character: :class:`FTE.characters.Character`
+        :param faction: The faction, e.g. ``"bridge crew"``.
+        :type faction: :obj:`typing.Hashable`
+        """
+        if character in (members := self._factions.setdefault(faction, {})):
+            return
+        members[character] = None
+        self._factions_of[character._slot] += (faction,)
+        self._sums[faction] = self._sums.get(faction, 0) + self._values[character._slot]
+
+    def leave(self, character: Character, faction: Hashable) -> None:
+        """Removes a character from a faction, if it's its' member.
+
+        :param character: The character.
+        :type character: :class:`FTE.characters.Character`
+        :param faction: The faction.
+        :type faction: :obj:`typing.Hashable`
+        """
+        if character not in (members := self._factions.get(faction, {})):
+            return
+        del members[character]
+        slot = character._slot
+        self._factions_of[slot] = tuple(f for f in self._factions_of[slot] if f != faction)
+        self._sums[faction] -= self._values[slot]
+
+    def moved(self, character: Character, old_location: Location | None) -> None:
+        """Moves a character's value between sums of locations, called by :class:`FTE.world.World`.
+
+        :param character: The character which moved.
+        :type character: :class:`FTE.characters.Character`
+        :param old_location: Where the character was before, `None` if it just appeared.
+        :type old_location: :class:`FTE.locations.Location` or `None`
+        """
+        value, sums = self._values[character._slot], self._sums
+        if old_location is not None:
+            sums[old_location] -= value
+        sums[character.location] = sums.get(character.location, 0) + value
+
+    def total(self, group: Hashable) -> int:
+        """Sum of numeric standings of a group's members.
+
+        :param group: A faction or a location.
+        :type group: :obj:`typing.Hashable`
+        :return: The sum, ``0`` for empty groups.
+        :rtype: :obj:`int`
+        """
+        return self._sums.get(group, 0)
+
+    def mean(self, group: Hashable) -> float:
+        """Average numeric standing of a group's members.
+
+        :param group: A faction or a location.
+        :type group: :obj:`typing.Hashable`
+        :return: The average, ``0.0`` for empty groups.
+        :rtype: :obj:`float`
+        """
+        if not (count := len(self.members(group))):
+            return 0.0
+        return self.total(group) / count
+
+    def standing(self, group: Hashable) -> Standing:
+        """Standing of a group as a whole, derived from its' average.
+
+        :param group: A faction or a location.
+        :type group: :obj:`typing.Hashable`
+        :return: The standing.
+        :rtype: :class:`FTE.characters.Standing`
+        """
+        return Standing.of(round(self.mean(group)))
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+Supervisor of many game servers, which spreads players across CPU cores.
+
+The supervisor imports the whole game once and forks worker processes, each
+running :class:`FTE.server.GameServer` on the same port (``SO_REUSEPORT``), so
+the system spreads new connections between them and new players don't wait
+for imports. Dead workers are restarted after a delay, which doubles with every
+restart of the same worker (up to :data:`MAX_RESTART_DELAY`), so a worker dying
+on start doesn't fork in a busy loop. A worker restarted ``max_restarts`` times
+is given up. Exit status of every dead worker is logged.
+
+Workers report their session count and memory usage, which can be read with
+:meth:`Supervisor.stats` or as JSON from the stats port::
+
+    python -m FTE.supervisor --port 2323 --workers 4 --stats-port 2324
+    nc 127.0.0.1 2324
+
+Requires a POSIX system.
+"""
+from argparse import ArgumentParser
+from asyncio import create_task, run, sleep
+from json import dumps
+from logging import INFO, basicConfig, getLogger
+from multiprocessing import Array
+from os import WNOHANG, _exit, cpu_count, fork, kill, waitpid, waitstatus_to_exitcode
+from resource import RUSAGE_SELF, getpagesize, getrusage
+from signal import SIGINT, SIGTERM, Signals, signal
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from threading import Thread
+from time import monotonic, sleep as wait
+
+# Imported before forking, so workers start warm. The game itself defers these until first use.
+import rich.table  # noqa: F401
+import FTE.chapters.one  # noqa: F401
+import FTE.world  # noqa: F401
+from FTE.console import CONSOLES
+from FTE.server import GameServer
+from FTE.settings import CONSOLE, PACING
+
+
+REPORT_INTERVAL: float = 0.5  # How often workers report their stats, in seconds
+RESTART_DELAY: float = 0.5  # Delay before the first restart of a worker, in seconds
+MAX_RESTART_DELAY: float = 30.0  # Longest delay before a restart, in seconds
+MAX_RESTARTS: int = 10  # How many times a worker is restarted before it's given up
+
+log = getLogger(__name__)
+
+
+def _memory() -> int:
+    """Memory used by the current process.
+
+    :return: Resident set size in bytes, or peak size if current isn't available.
+    :rtype: :obj:`int`
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * getpagesize()
+    except OSError:
+        return getrusage(RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Supervisor:
+    """Forks and watches worker processes.
+
+    :param host: Address workers listen on.
+    :type host: :obj:`str`
+    :param port: Port workers listen on.
+    :type port: :obj:`int`
+    :param workers: How many worker processes, defaults to the CPU count.
+    :type workers: :obj:`int`
+    :param max_sessions: How many games each worker can play at the same time.
+    :type max_sessions: :obj:`int`
+    :param pacing: Pacing of all games, see :func:`FTE.pacing.clock_from`.
+    :type pacing: :obj:`str`
+    :param console: Console of all games, ``"rich"`` or ``"ansi"``, see :mod:`FTE.console`.
+    :type console: :obj:`str`
+    :param max_restarts: How many times each worker is restarted, before it's given up.
+    :type max_restarts: :obj:`int`
+    """
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 2323,
+            *,
+            workers: int = None,
+            max_sessions: int = 4096,
+            pacing: str = PACING,
+            console: str = CONSOLE,
+            max_restarts: int = MAX_RESTARTS
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.workers: int = workers or cpu_count() or 1
+        self.max_sessions: int = max_sessions
+        self.pacing: str = pacing
+        self.console: str = console
+        self.max_restarts: int = max_restarts
+        self._pids: list[int] = [0] * self.workers  # ``0`` while a worker waits for its' restart, or was given up
+        self._restarts: list[int] = [0] * self.workers
+        self._due: dict[int, float] = {}  # Dead workers' slots mapped to times of their restarts
+        self._stats = Array('q', 2 * self.workers)  # Sessions and memory of each worker
+        self._running: bool = False
+        self._stats_port: int | None = None
+        self._stats_server: ThreadingTCPServer | None = None
+
+    def stats(self) -> list[dict[str, int]]:
+        """Current state of all workers.
+
+        :return: PID, active sessions, memory in bytes and restarts count of each worker.
+        :rtype: :obj:`list` of :obj:`dict`
+        """
+        return [
+            dict(
+                pid=self._pids[slot],
+                sessions=self._stats[2 * slot],
+                memory=self._stats[2 * slot + 1],
+                restarts=self._restarts[slot]
+            )
+            for slot in range(self.workers)
+        ]
+
+    async def _serve(self, slot: int) -> None:
+        """Runs a game server in a worker process and reports its stats.
+
+        :param slot: The worker's number.
+        :type slot: :obj:`int`
+        """
+        server = GameServer(
+            self.host,
+            self.port,
+            max_sessions=self.max_sessions,
+            pacing=self.pacing,
+            console=self.console,
+            reuse_port=True
+        )
+
+        async def report() -> None:
+            while True:
+                self._stats[2 * slot] = server.sessions
+                self._stats[2 * slot + 1] = _memory()
+                await sleep(REPORT_INTERVAL)
+
+        reporting = create_task(report())
+        try:
+            await server.serve_forever()
+        finally:
+            reporting.cancel()
+
+    def _spawn(self, slot: int) -> None:
+        """Forks a worker process.
+
+        :param slot: The worker's number.
+        :type slot: :obj:`int`
+        """
+        if (pid := fork()) == 0:
+            signal(SIGINT, lambda *_: _exit(0))
+            signal(SIGTERM, lambda *_: _exit(0))
+            if self._stats_server:
+                self._stats_server.socket.close()
+            try:
+                run(self._serve(slot))
+            finally:
+                _exit(1)
+        self._pids[slot] = pid
+        self._stats[2 * slot] = self._stats[2 * slot + 1] = 0
+
+    def _stop(self, *_) -> None:
+        """Stops all workers."""
+        self._running = False
+        self._due.clear()
+        for pid in self._pids:
+            if not pid:
+                continue
+            try:
+                kill(pid, SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def serve_stats(self, port: int) -> None:
+        """Serves :meth:`stats` as JSON in a background thread, once :meth:`run` has forked all workers.
+
+        Workers are forked from a single threaded process. Restarted workers are forked while the stats
+        thread runs, which is safe: the thread only holds its' own socket (closed by the worker) and
+        no lock, which a worker uses.
+
+        :param port: Port of the stats server.
+        :type port: :obj:`int`
+        """
+        self._stats_port = port
+
+    def _start_stats(self) -> None:
+        """Starts the stats server requested with :meth:`serve_stats`."""
+        supervisor = self
+
+        class Handler(StreamRequestHandler):
+            def handle(self) -> None:
+                self.wfile.write(dumps(supervisor.stats()).encode() + b'\n')
+
+        ThreadingTCPServer.allow_reuse_address = True
+        self._stats_server = ThreadingTCPServer((self.host, self._stats_port), Handler)
+        Thread(target=self._stats_server.serve_forever, daemon=True).start()
+
+    def _died(self, slot: int, status: int) -> None:
+        """Logs a dead worker's exit status and schedules its' restart, or gives it up.
+
+        :param slot: The worker's number.
+        :type slot: :obj:`int`
+        :param status: The worker's exit status, as returned by :func:`os.waitpid`.
+        :type status: :obj:`int`
+        """
+        pid, self._pids[slot] = self._pids[slot], 0
+        code = waitstatus_to_exitcode(status)
+        reason = f'killed by {Signals(-code).name}' if code < 0 else f'exited with code {code}'
+        if self._restarts[slot] >= self.max_restarts:
+            log.error('Worker %d (PID %d) %s, given up after %d restarts', slot, pid, reason, self._restarts[slot])
+            return
+        delay = min(RESTART_DELAY * 2 ** self._restarts[slot], MAX_RESTART_DELAY)
+        log.warning('Worker %d (PID %d) %s, restarting in %.1f s', slot, pid, reason, delay)
+        self._due[slot] = monotonic() + delay
+
+    def _restart_due(self) -> float | None:
+        """Restarts workers, whose delay has passed.
+
+        :return: Seconds until the next restart, `None` if no restart is scheduled.
+        :rtype: :obj:`float` or `None`
+        """
+        now = monotonic()
+        for slot in [slot for slot, due in self._due.items() if due <= now]:
+            del self._due[slot]
+            self._restarts[slot] += 1
+            self._spawn(slot)
+        return min(self._due.values()) - now if self._due else None
+
+    def run(self) -> None:
+        """Forks workers and restarts them until stopped with ``SIGINT`` or ``SIGTERM``,
+        or until all workers are given up."""
+        self._running = True
+        signal(SIGINT, self._stop)
+        signal(SIGTERM, self._stop)
+        for slot in range(self.workers):
+            self._spawn(slot)
+        if self._stats_port:
+            self._start_stats()
+        while self._running:
+            delay = self._restart_due()
+            try:
+                pid, status = waitpid(-1, 0 if delay is None else WNOHANG)
+            except ChildProcessError:
+                if delay is None:
+                    break
+                pid = 0
+            except InterruptedError:
+                continue
+            if not pid:
+                wait(delay)
+            elif self._running and pid in self._pids:
+                self._died(self._pids.index(pid), status)
+        while True:
+            try:
+                waitpid(-1, 0)
+            except ChildProcessError:
+                break
+
+
+def main() -> None:
+    parser = ArgumentParser('python -m FTE.supervisor', description='Hosts Fix The Engines on all CPU cores.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=2323)
+    parser.add_argument('--workers', type=int, help='defaults to the CPU count')
+    parser.add_argument('--max-sessions', type=int, default=4096, help='per worker')
+    parser.add_argument('--pacing', default=PACING, help='"real", "virtual" or a scale factor')
+    parser.add_argument('--console', choices=CONSOLES, default=CONSOLE, help='how output is rendered')
+    parser.add_argument('--max-restarts', type=int, default=MAX_RESTARTS, help='per worker, before it\'s given up')
+    parser.add_argument('--stats-port', type=int, help='serve workers\' stats as JSON on this port')
+    args = parser.parse_args()
+    supervisor = Supervisor(
+        args.host,
+        args.port,
+        workers=args.workers,
+        max_sessions=args.max_sessions,
+        pacing=args.pacing,
+        console=args.console,
+        max_restarts=args.max_restarts
+    )
+    basicConfig(level=INFO, format='%(asctime)s %(levelname)s %(message)s')
+    if args.stats_port:
+        supervisor.serve_stats(args.stats_port)
+    supervisor.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -2,17 +2,53 @@
 """
 Comonnly used functions between classes and chapters.
 """
-from time import sleep
+from itertools import groupby
+from math import ceil
 
+from rich.console import COLOR_SYSTEMS
 from rich.text import Text
 
-from FTE.console import console
-from FTE.settings import DEBUG
+from FTE.console import GameConsole, style_runs
+from FTE.session import get_session
 
 
-def print_with_interval(text: str, interval: float, end: str = '\n') -> None:
+TERMINAL_TICK: float = 1 / 60  # Shortest real time between two writes of the typewriter
+
+
+def _typewriter_chunks(console: GameConsole, text: str | Text, size: int) -> list[str]:
+    """Renders text once and splits it into ready to write pieces.
+
+    :param console: Console to render for.
+    :type console: :class:`FTE.console.GameConsole` or :class:`FTE.console.AnsiConsole`
+    :param text: Text to be rendered, strings are not parsed as markup.
+    :type text: :obj:`str` or :class:`rich.text.Text`
+    :param size: How many characters each piece contains.
+    :type size: :obj:`int`
+    :return: Pieces of rendered text, including terminal control codes.
+    :rtype: :obj:`list` of :obj:`str`
+    """
+    color_system = COLOR_SYSTEMS.get(console.color_system)
+    cells = [
+        (char, style)
+        for run, style in style_runs(text if isinstance(text, Text) else Text(text))
+        for char in run
+    ]
+    chunks: list[str] = []
+    for start in range(0, len(cells), size):
+        chunk = ''
+        for style, run in groupby(cells[start:start + size], key=lambda cell: cell[1]):
+            run = ''.join(char for char, _ in run)
+            chunk += style.render(run, color_system=color_system) if style else run
+        chunks.append(chunk)
+    return chunks
+
+
+async def print_with_interval(text: str, interval: float, end: str = '\n') -> None:
     """Displays text character by character with desired interval.
 
+    The text is rendered only once. If the interval is shorter than a terminal
+    tick, several characters are written at once to keep the same overall pace.
+
     :param text: Text to be displayed.
     :type text: :obj:`str`
     :param interval: Time between each character to be displayed.
@@ -20,16 +56,19 @@ def print_with_interval(text: str, interval: float, end: str = '\n') -> None:
     :param end: Overrides ending caracter, defaults to ``"\\n"``.
     :type end: :obj:`str`
     """
-    for char in text:
-        if not DEBUG:
-            sleep(interval)
-        console.print(char, end='')
-    if not DEBUG:
-        sleep(interval)
+    session = get_session()
+    console = session.console
+    real_interval = session.clock.duration(interval)
+    size = max(1, ceil(TERMINAL_TICK / real_interval)) if real_interval > 0 else max(1, len(text))
+    for chunk in _typewriter_chunks(console, text, size):
+        await session.pause(interval * size)
+        console.file.write(chunk)
+        console.flush()
+    await session.pause(interval)
     console.print('', end=end)
 
 
-def slow_print(text: str, end: str = '\n') -> None:
+async def slow_print(text: str, end: str = '\n') -> None:
     """Slowly displays text character by character.
 
     :param text: Text to be displayed.
@@ -37,10 +76,10 @@ def slow_print(text: str, end: str = '\n') -> None:
     :param end: Overrides ending caracter, defaults to ``"\\n"``.
     :type end: :obj:`str`
     """
-    print_with_interval(text, 0.1, end)
+    await print_with_interval(text, 0.1, end)
 
 
-def slower_print(text: str, end: str = '\n') -> None:
+async def slower_print(text: str, end: str = '\n') -> None:
     """Very slowly displays text character by character.
 
     :param text: Text to be displayed.
@@ -48,19 +87,20 @@ def slower_print(text: str, end: str = '\n') -> None:
     :param end: Overrides ending caracter, defaults to ``"\\n"``.
     :type end: :obj:`str`
     """
-    print_with_interval(text, 0.5, end)
+    await print_with_interval(text, 0.5, end)
 
 
-def story(text: list[str | Text]) -> None:
+async def story(text: list[str | Text]) -> None:
     """Displays a bunch of text in easy readible form for player.
 
     :param text: A text to be displayed. Could be a single text or
     :type text: :obj:`list` of :obj:`str` or :class:`rich.text.Text`
     """
+    session = get_session()
+    console = session.console
     if isinstance(text, list):
         for seg in text:
             console.print(seg)
-            if not DEBUG:
-                sleep(5.0)
+            await session.pause(5.0)
     else:
         console.print(text)
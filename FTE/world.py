@@ -2,16 +2,25 @@
 """
 Main game component, everything about user interactions. "Glues" together all components.
 """
-from time import sleep
+from typing import TYPE_CHECKING, Callable
 
 from rich.style import Style
-from rich.table import Table
 from rich.text import Text
 
-from FTE.console import console
+from FTE.catalog import catalog
+from FTE.console import GameConsole
 from FTE.characters import Character
+from FTE.entities import Entity, fold
+from FTE.events import Event, EventBus, EventType
+from FTE.graph import LocationGraph
 from FTE.locations import Location
-from FTE.settings import DEBUG
+from FTE.parser import Vocabulary
+from FTE.results import HelpTable, Message, Result, Retry, Speech
+from FTE.session import get_session
+from FTE.standings import Standings
+
+if TYPE_CHECKING:
+    from FTE.simulation import Simulation
 
 
 class UnknownCommand(BaseException):
@@ -26,7 +35,7 @@ class UnknownCharacter(BaseException):
     """Character doesn't exist."""
 
 
-class Command:
+class Command(Entity):
     """How player can interact with the game. Represents player's action.
 
     :param name: Which word invokes the command.
@@ -35,17 +44,23 @@ class Command:
     :type description: :obj:`str`
     :param usage: Example usage of a command with expected types.
     :type usage: :obj:`str`
+    :param destructive: If the command can't be abbreviated, it must be typed in full, e.g. ``exit``.
+    :type destructive: :obj:`bool`
     """
+    __slots__ = ('description', '_usage', 'destructive')
+
     def __init__(
             self,
             name: str,
             description: str = None,
             *,
-            usage: str = None
+            usage: str = None,
+            destructive: bool = False
     ) -> None:
-        self.name: str = name
+        super().__init__(name)
         self.description: str = description
         self._usage: str = usage or ''
+        self.destructive: bool = destructive
 
     @property
     def usage(self) -> str:
@@ -58,33 +73,61 @@ class Command:
 COMMANDS: dict[str, Command] = dict(  # All available commands
     exit = Command(
         'exit',
-        'Exits the game.'
+        catalog['command.exit'],
+        destructive=True
     ),
     help = Command(
         'help',
-        'Shows help. Optionally only "commands" or "arguments".',
+        catalog['command.help'],
         usage='("commands" | "arguments")'
     ),
     talk = Command(
         'talk',
-        'Talk to someone.' +
-        ' Pass character name to start conversation with them.' +
-        ' You can talk only to characters in your location.',
+        catalog['command.talk'],
         usage='<character name>'
     ),
     go = Command(
         'go',
-        'Go somewhere.' +
-        ' Pass location name to go there.',
+        catalog['command.go'],
         usage='<location name>'
     ),
     info = Command(
         'info',
-        'Get information about a character or a location.' +
-        ' Do not pass anything to show info about current location.',
+        catalog['command.info'],
         usage='(charcter name | location name)'
     )
 )
+HELP_MENUS: Vocabulary = Vocabulary(dict(commands='commands', arguments='arguments'))
+_command_vocabularies: dict[tuple[str], Vocabulary] = {}
+
+
+def _commands() -> Vocabulary:
+    """Vocabulary of :data:`COMMANDS`, rebuilt when commands change.
+
+    :return: Command names mapped to commands.
+    :rtype: :class:`FTE.parser.Vocabulary`
+    """
+    if (vocabulary := _command_vocabularies.get(key := tuple(COMMANDS))) is None:
+        _command_vocabularies.clear()
+        _command_vocabularies[key] = vocabulary = Vocabulary(COMMANDS)
+    return vocabulary
+
+
+def _command(name: str) -> Command | None:
+    """Command typed by the player, or its' unambiguous prefix. Destructive commands must be typed in full.
+
+    :param name: What the player typed.
+    :type name: :obj:`str`
+    :return: The command, `None` if there is no such command.
+    :rtype: :class:`FTE.world.Command` or `None`
+    """
+    if (command := COMMANDS.get(name)) is None and (command := _commands().resolve(name)) and command.destructive:
+        return None
+    return command
+
+
+_UNKNOWN_LOCATION = Location('???')  # Shown when the player is outside of the world's locations
+_HELP: Text = Text(catalog['world.help'], style=Style(color='blue'))  # Prefix of help mode
 
 
 class World:
@@ -100,6 +143,10 @@ class World:
     :type first_interaction: :obj:`bool`
     :param assistant: If game assistant should be enabled.
     :type assistant: :obj:`bool`
+    :param doors: Pairs of connected locations, see :class:`FTE.graph.LocationGraph`.
+        Defaults to `None`, then the player can go from any location to any other. An empty list
+        is a world with all doors closed, which are opened during the game.
+    :type doors: :obj:`list` of :obj:`tuple`
     """
     def __init__(
             self,
@@ -107,52 +154,190 @@ class World:
             all_characters: tuple[Character],
             starting_location: Location,
             first_interaction: bool = False,
-            assistant: bool = False
+            assistant: bool = False,
+            doors: list[tuple[Location, Location]] = None
     ) -> None:
-        self._all_locations: tuple[Location] = all_locations
-        self._all_characters: tuple[Character] = all_characters
+        self._all_locations: list[Location] = []
+        self._all_characters: list[Character] = []
+        self._locations_by_name: dict[str, list[Location]] = {}
+        self._characters_by_name: dict[str, list[Character]] = {}
+        self._location_names: Vocabulary = Vocabulary()  # Only known names mapped to known entities, for abbreviations and suggestions
+        self._character_names: Vocabulary = Vocabulary()
+        self._occupants: dict[Location, dict[Character, None]] = {}
+        self._occupancy: dict[Location, int] = {}  # Locations mapped to versions of their occupants, changed by every move
+        self._listings: dict[tuple[str, Location], tuple[tuple, tuple[Message, ...]]] = {}  # See :meth:`_show_listing`
+        self.events: EventBus = EventBus()
+        self.standings: Standings = Standings(self._occupants, self.events)
+        for location in all_locations:
+            self.add_location(location)
+        for character in all_characters:
+            self.add_character(character)
         self._location: Location = starting_location
         self._fails = 0
+        self._completions: list[str] = []
+        self._completion_enabled: bool = False
         self._first_interaction = first_interaction
         self._assistant: bool = assistant
+        self.graph: LocationGraph = LocationGraph(doors)
+        self._doors: bool = doors is not None  # Without doors, all locations are neighbours
+        self.simulation: Simulation | None = None  # Set by :class:`FTE.simulation.Simulation`
+
+    @staticmethod
+    def _index(index: dict[str, list[Entity]], entity: Entity) -> None:
+        """Adds an entity to a name index.
+
+        :param index: Case-folded names mapped to entities with that name.
+        :type index: :obj:`dict`
+        :param entity: The entity to add.
+        :type entity: :class:`FTE.entities.Entity`
+        """
+        index.setdefault(fold(entity.name), []).append(entity)
+
+    @staticmethod
+    def _unindex(index: dict[str, list[Entity]], entity: Entity, name: str) -> None:
+        """Removes an entity from a name index.
+
+        :param index: Case-folded names mapped to entities with that name.
+        :type index: :obj:`dict`
+        :param entity: The entity to remove.
+        :type entity: :class:`FTE.entities.Entity`
+        :param name: The name under which the entity is indexed.
+        :type name: :obj:`str`
+        """
+        bucket = index.get(key := fold(name), [])
+        bucket[:] = [e for e in bucket if e is not entity]
+        if not bucket:
+            index.pop(key, None)
+
+    def _indexes(self, entity: Entity) -> tuple[dict[str, list[Entity]], Vocabulary]:
+        """Name indexes of the entity's kind.
+
+        :param entity: The entity.
+        :type entity: :class:`FTE.entities.Entity`
+        :return: All names index and known names vocabulary.
+        :rtype: :obj:`tuple`
+        """
+        if isinstance(entity, Location):
+            return self._locations_by_name, self._location_names
+        return self._characters_by_name, self._character_names
+
+    def _update_known_names(self, entity: Entity, name: str) -> None:
+        """Adds a name to known names if any entity with that name is known, removes it otherwise.
+
+        :param entity: Entity of the same kind.
+        :type entity: :class:`FTE.entities.Entity`
+        :param name: The name.
+        :type name: :obj:`str`
+        """
+        index, names = self._indexes(entity)
+        if (known := next((e for e in index.get(fold(name), ()) if e.known), None)):
+            names.insert(known.name, known)
+        else:
+            names.remove(name)
+
+    def _entity_renamed(self, entity: Entity, old_name: str) -> None:
+        """Keeps name indexes up to date, called by :attr:`FTE.entities.Entity.name`.
+
+        :param entity: Renamed entity.
+        :type entity: :class:`FTE.entities.Entity`
+        :param old_name: The entity's previous name.
+        :type old_name: :obj:`str`
+        """
+        index, _ = self._indexes(entity)
+        self._unindex(index, entity, old_name)
+        self._index(index, entity)
+        self._update_known_names(entity, old_name)
+        self._update_known_names(entity, entity.name)
+
+    def _entity_known_changed(self, entity: Entity) -> None:
+        """Keeps known names up to date, called by :attr:`FTE.entities.Entity.known`.
+
+        :param entity: Revealed or hidden entity.
+        :type entity: :class:`FTE.entities.Entity`
+        """
+        self._update_known_names(entity, entity.name)
+
+    def add_location(self, location: Location) -> None:
+        """Adds a location to the world.
+
+        :param location: The location to add.
+        :type location: :class:`FTE.locations.Location`
+        """
+        location._world = self
+        self._all_locations.append(location)
+        self._index(self._locations_by_name, location)
+        self._update_known_names(location, location.name)
+
+    def add_character(self, character: Character) -> None:
+        """Adds a character to the world.
+
+        :param character: The character to add.
+        :type character: :class:`FTE.characters.Character`
+        """
+        character._world = self
+        self._all_characters.append(character)
+        self._index(self._characters_by_name, character)
+        self._update_known_names(character, character.name)
+        self.standings.add(character)
+        self._character_moved(character, None)
+
+    def _character_moved(self, character: Character, old_location: Location | None) -> None:
+        """Keeps the occupancy index, standings of locations and the simulation up to date and posts the move's event,
+        called by :attr:`FTE.characters.Character.location`.
+
+        :param character: The character which moved.
+        :type character: :class:`FTE.characters.Character`
+        :param old_location: Where the character was before, `None` if it just appeared.
+        :type old_location: :class:`FTE.locations.Location` or `None`
+        """
+        if old_location is not None:
+            occupants = self._occupants.get(old_location, {})
+            occupants.pop(character, None)
+            if not occupants:
+                self._occupants.pop(old_location, None)
+            self._occupancy[old_location] = self._occupancy.get(old_location, 0) + 1
+        self._occupants.setdefault(character.location, {})[character] = None
+        self._occupancy[character.location] = self._occupancy.get(character.location, 0) + 1
+        self.standings.moved(character, old_location)
+        if old_location is not None:
+            if self.simulation is not None:
+                self.simulation.moved(character)
+            self.events.post(EventType.CHARACTER_MOVED, character)
+
+    @property
+    def _console(self) -> GameConsole:
+        """Console of the current session."""
+        return get_session().console
 
     @property
     def location(self) -> Location:
         """Player's current location. Displays ``"???"`` if location is not known by the player."""
-        if self._location not in self._all_locations:
-            return Location('???')
+        if self._location._world is not self:
+            return _UNKNOWN_LOCATION
         return self._location
 
     @property
     def characters(self) -> tuple[Character]:
         """All characters in player's current location."""
-        return tuple(c for c in self._all_characters if c.location.name == self._location.name)
+        return tuple(self._occupants.get(self._location, ()))
 
     def _prefix(self) -> None:
         """Displays before game console's input field with current location's name."""
-        console.print(Text.assemble('[ ', self.location.display_name, ' ] '), end='')
+        self._console.print(Text.assemble('[ ', self.location.display_name, ' ] '), end='')
 
     def _prefix_help(self) -> None:
         """Displays before game console's input field inside help menu/mode."""
-        console.print('[', Text.assemble( 'Help', style=Style(color='blue') ), ']', end=' ')
+        self._console.print('[', _HELP, ']', end=' ')
 
     def find_location(self, name: str) -> Location | None:
-        """Tries to find a location in all locations by its' name.
+        """Tries to find a known location by its' name.
 
         :param name: The location's name to be found.
         :type name: :obj:`str`
         :return: The location if it's found, `None` otherwise.
         :rtype: :class:`FTE.locations.Location` or `None`
         """
-        try:
-            location = tuple(filter(
-                lambda l: l.name.lower() == name.lower() and l.known,
-                self._all_locations
-            ))[0]
-        except IndexError:
-            return None
-        else:
-            return location
+        return next((l for l in self._locations_by_name.get(fold(name), ()) if l.known), None)
 
     def find_character(self, name: str) -> Character | None:
         """Tries to find a character in all characters by it's name.
@@ -162,19 +347,7 @@ class World:
         :return: The character if it's found, `None` otherwise.
         :rtype: :class:`FTE.characters.Character` or `None`
         """
-        return next((c for c in self._all_characters if c.name.lower() == name.lower()), None)
-
-    def _character_in(self, name: str, scope: tuple[Character] | list[Character]) -> bool:
-        """Checks if character is in a location.
-
-        :param name: Character's name to be checked.
-        :type name: :obj:`str`
-        :param scope: List of characters to search in.
-        :type scope: :obj:`tuple` of :class:`FTE.characters.Character` or :obj:`list` of :class:`FTE.characters.Character`
-        :return: `True` if character is in a location, `False` otherwise.
-        :rtype: :obj:`bool`
-        """
-        return any(c.name.lower() == name.lower() and c.known for c in scope)
+        return next(iter(self._characters_by_name.get(fold(name), ())), None)
 
     def character_in_global(self, name: str) -> bool:
         """Checks if character exists.
@@ -184,7 +357,7 @@ class World:
         :return: `True` if character exists, `False` otherwise.
         :rtype: :obj:`bool`
         """
-        return self._character_in(name, self._all_characters)
+        return any(c.known for c in self._characters_by_name.get(fold(name), ()))
 
     def character_in_location(self, name: str) -> bool:
         """Checks if character is in the same location.
@@ -194,9 +367,10 @@ class World:
         :return: `True` if character is in the same location as the player, `False` otherwise.
         :rtype: :obj:`bool`
         """
-        return self._character_in(name, self.characters)
+        occupants = self._occupants.get(self._location, {})
+        return any(c.known and c in occupants for c in self._characters_by_name.get(fold(name), ()))
 
-    def character_enters(
+    async def character_enters(
             self,
             character: Character,
             *,
@@ -212,9 +386,9 @@ class World:
         if not self.character_in_location(character.name):
             character.location = self._location
             if not silently:
-                character.action('Walks in.')
+                await character.action(catalog['world.enters'])
 
-    def character_leaves(
+    async def character_leaves(
             self,
             character: Character,
             goes_to: Location,
@@ -233,87 +407,125 @@ class World:
         if self.character_in_location(character.name):
             character.location = goes_to
             if not silently:
-                character.action('Walks out.')
+                await character.action(catalog['world.leaves'])
 
-    def _show_location_characters(self) -> None:
-        """Displays characters count and list in player's location."""
-        self._prefix()
-        if (l := len(self.characters)) == 0:
-            console.print('There are no characters in this location.')
-            return
-        if l == 1:
-            console.print('There is 1 character in this location: ', end='')
-        else:
-            console.print(f'There are {l} characters in this location: ', end='')
-        location_characters: list[str | Text] = []
-        for char in self.characters:
-            location_characters.append(char.display_name)
-            location_characters.append(', ')
-        location_characters = location_characters[:-1]
-        console.print(*location_characters, '.', sep='')
-
-    def _show_other_locations(self) -> None:
-        """Displays count and list of available locations."""
-        self._prefix()
-        other_locations = tuple(filter(lambda l: l != self.location, self._all_locations))
-        if (l := len(other_locations)) == 0:
-            console.print('There are no other locations you can go to.')
+    def _post(self, result: Result, event: Event) -> None:
+        """Adds an event to a result and posts it to :attr:`events`. It's dispatched at the end of :meth:`execute`,
+        or after the result is displayed by :meth:`interaction`.
+
+        :param result: The result.
+        :type result: :class:`FTE.results.Result`
+        :param event: The event.
+        :type event: :class:`FTE.events.Event`
+        """
+        result.events.append(event)
+        self.events.post(event.type, event.target)
+
+    def _say(self, result: Result, template: str, *args, end: str = '\n') -> None:
+        """Adds a message displayed after player's location to a result.
+
+        :param result: The result.
+        :type result: :class:`FTE.results.Result`
+        :param template: The message, optionally with ``{}`` placeholders.
+        :type template: :obj:`str`
+        :param end: Ending of the message, defaults to ``"\\n"``.
+        :type end: :obj:`str`
+        """
+        result.messages.append(Message(template, *args, location=self.location, end=end))
+
+    def _did_you_mean(self, result: Result, suggestions: list) -> None:
+        """Adds suggestions to a result, if there are any.
+
+        :param result: The result.
+        :type result: :class:`FTE.results.Result`
+        :param suggestions: Suggested entities or words.
+        :type suggestions: :obj:`list`
+        """
+        if not suggestions:
             return
-        if l == 1:
-            console.print('There is 1 other location you can go to: ', end='')
-        else:
-            console.print(f'There are {l} other locations you can go to: ', end='')
-        locations: list[str | Text] = []
-        for loc in other_locations:
-            locations.append(loc.display_name)
-            locations.append(', ')
-        locations = locations[:-1]
-        console.print(*locations, '.', sep='')
-
-    def _do_first_interaction(self) -> None:
+        *others, last = ['{}'] * len(suggestions)
+        choices = ', '.join(others) + catalog['world.or'] + last if others else last
+        self._say(result, catalog['world.did_you_mean'].format(choices=choices), *suggestions)
+
+    def _show_listing(self, result: Result, kind: str, state: object, entities: Callable[[], tuple[Entity, ...]]) -> None:
+        """Adds count and list of entities to a result.
+
+        The messages are reused until player's location or the listing's state changes,
+        so their colored text is assembled once, not on every turn (see :class:`FTE.results.Message`).
+
+        :param result: The result.
+        :type result: :class:`FTE.results.Result`
+        :param kind: ``"characters"`` or ``"locations"``, selects texts of the catalog.
+        :type kind: :obj:`str`
+        :param state: What the listing depends on, besides player's location.
+        :param entities: Returns the listed entities.
+        :type entities: :obj:`typing.Callable`
+        """
+        key, state = (kind, self._location), (self.location, state)
+        if (listing := self._listings.get(key)) is None or listing[0] != state:
+            listed, location = entities(), self.location
+            if (l := len(listed)) == 0:
+                messages = Message(catalog[f'world.{kind}.none'], location=location),
+            elif l == 1:
+                messages = Message(catalog[f'world.{kind}.one'], location=location, end=''), Message('{}.', *listed)
+            else:
+                messages = (
+                    Message(catalog[f'world.{kind}.many'].format(count=l), location=location, end=''),
+                    Message(', '.join(['{}'] * l) + '.', *listed)
+                )
+            self._listings[key] = listing = state, messages
+        result.messages.extend(listing[1])
+
+    def _show_location_characters(self, result: Result) -> None:
+        """Adds characters count and list in player's location to a result."""
+        self._show_listing(result, 'characters', self._occupancy.get(self._location, 0), lambda: self.characters)
+
+    def neighbours(self, location: Location) -> tuple[Location, ...]:
+        """Locations the player can go to directly from a location.
+
+        :param location: The location.
+        :type location: :class:`FTE.locations.Location`
+        :return: Locations behind the location's doors, all other locations if the world was built without doors.
+        :rtype: :obj:`tuple` of :class:`FTE.locations.Location`
+        """
+        if not self._doors:
+            return tuple(l for l in self._all_locations if l != location)
+        return self.graph.neighbours(location)
+
+    def _show_other_locations(self, result: Result) -> None:
+        """Adds count and list of neighbouring locations to a result."""
+        other_locations = self.neighbours(self.location)
+        self._show_listing(result, 'locations', other_locations, lambda: other_locations)
+
+    async def _do_first_interaction(self) -> None:
         """Displays basic information how to play and asks if player needs additional help."""
         self._prefix_help()
-        console.print(
-            'This is your first interaction with the World.',
-            'Would you like to enable assitant?'
-        )
+        self._console.print(catalog.text('world.first.welcome'), catalog.text('world.first.assistant'))
         expect = ('yes', 'no')
         self._prefix_help()
-        query = console.input('')
+        session = get_session()
+        query = await session.input('')
         while query.lower() not in expect:
             self._prefix_help()
-            query = console.input('"yes" or "no"? ')
+            query = await session.input(catalog.text('world.first.yes_or_no'))
         self._first_interaction = False
         if query == 'no':
             self._prefix_help()
-            console.print('OK! I won\'t ask you again. Have fun!')
+            self._console.print(catalog.text('world.first.declined'))
             return
-        for line in (
-            Text.assemble(
-                Text.assemble('Fix The Engines', style=Style(bold=True)),
-                ' is text-based, paragraph game. There is no mouse control,',
-                ' you operate only with commands.'
-            ),
-            'You can show them by typing "help" during interaction' +
-            ' with the World.',
-            'All commands are single words. For example "help" or' +
-            ' "go" insted of "go to".',
-            'Have fun! :smile:'
-        ):
+        for key in ('world.first.about', 'world.first.help', 'world.first.commands', 'world.first.fun'):
             self._prefix_help()
-            console.print(line)
-            if not DEBUG:
-                sleep(2.0)
+            self._console.print(catalog.text(key))
+            await session.pause(2.0)
         self._assistant = True
 
-    def _command_exit(self) -> None:
+    def _command_exit(self, result: Result) -> None:
         """Exits the game."""
-        self._prefix()
-        console.print('Goodbye!')
-        exit()
+        self._say(result, catalog['world.exit'])
+        result.exit = True
 
-    def _command_help(self, menu: str = None) -> None:
-        """Displays help menu."""
+    def _command_help(self, result: Result, menu: str = None) -> None:
+        """Adds help menu to a result."""
         show_commands, show_arguments = False, False
         if menu == 'commands':
             show_commands = True
@@ -322,29 +534,24 @@ class World:
         else:
             show_commands, show_arguments = True, True
         if show_commands:
-            commands_table = Table(
-                title='Available commands',
+            result.messages.append(HelpTable(
+                catalog['help.commands'],
+                (catalog['help.command'], catalog['help.description'], catalog['help.usage']),
+                [(cmd.name, cmd.description, cmd.usage) for cmd in COMMANDS.values()],
                 show_lines=True
-            )
-            commands_table.add_column('Command')
-            commands_table.add_column('Description')
-            commands_table.add_column('Usage')
-            for cmd in COMMANDS.values():
-                commands_table.add_row(cmd.name, cmd.description, cmd.usage)
-            console.print(commands_table)
+            ))
         if show_arguments:
-            arguments_table = Table(title='Arguments description')
-            arguments_table.add_column('Representation')
-            arguments_table.add_column('Description')
-            for line in (
-                ('< ... >', 'Required argument.'),
-                ('( ... )', 'Optional argument.'),
-                ('( a | b )', 'Optional argument, but only "a" or "b".')
-            ):
-                arguments_table.add_row(*line)
-            console.print(arguments_table)
-
-    def _command_talk(self, character_name: str) -> Character | None:
+            result.messages.append(HelpTable(
+                catalog['help.arguments'],
+                (catalog['help.representation'], catalog['help.description']),
+                [
+                    ('< ... >', catalog['help.required']),
+                    ('( ... )', catalog['help.optional']),
+                    ('( a | b )', catalog['help.choice'])
+                ]
+            ))
+
+    def _command_talk(self, result: Result, character_name: str) -> None:
         """
         Tries to talk to a :class:`FTE.characters.Character`.
         The character must:
@@ -354,91 +561,93 @@ class World:
         - be pokable.
 
         If no name is specified, nothing happens.
+        The character player talks to becomes result's target.
 
+        :param result: The result.
+        :type result: :class:`FTE.results.Result`
         :param character_name: The character's name to which player is trying to talk.
         :type character_name: :obj:`str`
-        :return: The character player is trying to talk. `None` if the character doesn't meet above requirements.
-        :rtype: :class:`FTE.characters.Character` or `None`
         """
         if not character_name:
-            self._prefix()
-            console.print('You speak to everyone, but no one hears you.')
-            return None
+            self._say(result, catalog['world.talk.nobody'])
+            return
         if not self.character_in_global(character_name):
-            self._prefix()
-            console.print('You don\'t know this character.')
-            return None
+            self._say(result, catalog['world.talk.unknown'])
+            self._did_you_mean(result, self._character_names.suggest(character_name))
+            return
         if not self.character_in_location(character_name):
-            self._prefix()
-            console.print('This chracter is not here.')
-            return None
+            self._say(result, catalog['world.talk.absent'])
+            return
         char = self.find_character(character_name)
         if not char.pokable:
-            self._prefix()
-            console.print(Text.assemble(char.display_name, ' does not want to talk with you.'))
-            return None
-        char.monologue(char.poke)
-        return char
+            self._say(result, catalog['world.talk.unwilling'], char)
+            return
+        result.messages.append(Speech(char, char.poke))
+        self._post(result, Event(EventType.TALK, char))
+        result.target = char
 
-    def _command_go(
-            self,
-            location_name: str = None,
-    ) -> Location | None:
-        """Tries to go to a location.
+    def _command_go(self, result: Result, location_name: str = None) -> None:
+        """Tries to go to a location. The location player goes to becomes result's target.
 
+        :param result: The result.
+        :type result: :class:`FTE.results.Result`
         :param location_name: The location's name to which player is trying to go to. If no name is specified, nothing happens.
         :type location_name: :obj:`str`
-        :return: The location player is trying to go. `None` if the location doesn't exist or player is already in wanted location.
-        :rtype: :class:`FTE.locations.Location` or `None`
         """
         if not location_name:
-            self._prefix()
-            console.print('After running in circle for a while you find it worthless.')
-            return None
+            self._say(result, catalog['world.go.nowhere'])
+            return
         if not (location := self.find_location(location_name)):
-            self._prefix()
-            console.print('You don\'t know this location.')
-            return None
+            self._say(result, catalog['world.go.unknown'])
+            self._did_you_mean(result, self._location_names.suggest(location_name))
+            return
         if self._location == location:
-            console.print('You\'re currently here.')
-            return None
+            result.messages.append(Message(catalog['world.go.here']))
+            return
+        if self._doors and not self.graph.connected(self._location, location):
+            if (route := self.graph.route(self._location, location)) is None:
+                self._say(result, catalog['world.go.unreachable'], location)
+                return
+            self._say(result, catalog['world.go.through'], end='')
+            result.messages.append(Message(', '.join(['{}'] * (len(route) - 1)) + '.', *route[:-1]))
         self._location = location
-        self._prefix()
-        console.print(Text.assemble('You\'re now in ', self.location.display_name, '.'))
-        self._show_location_characters()
-        return location
-
-    def _command_info(self, name: str = None) -> None:
-        """Displays informaiom about a character or location.
-
+        if self.simulation is not None:
+            self.simulation.observe()
+        self._say(result, catalog['world.go.arrived'], self.location)
+        self._show_location_characters(result)
+        self._post(result, Event(EventType.GO, location))
+        result.target = location
+
+    def _command_info(self, result: Result, name: str = None) -> None:
+        """Adds informaiom about a character or location to a result.
+
+        :param result: The result.
+        :type result: :class:`FTE.results.Result`
         :param name: Character or location name the player wants information baout, defaults to current location.
         :type name: :obj:`str`
         """
         if not name:
             name = self._location.name
         if (loc := self.find_location(name)):
-            self._prefix()
             if (i := loc.info):
-                console.print(i)
+                self._say(result, i)
             else:
-                console.print('You don\'t know anything about this location.')
+                self._say(result, catalog['world.info.unknown_location'])
             if loc == self._location:
-                self._show_location_characters()
-                self._show_other_locations()
+                self._show_location_characters(result)
+                self._show_other_locations(result)
         elif (char := self.find_character(name)):
-            self._prefix()
-            console.print(Text.assemble(
-                char.display_name,
-                ' has ',
-                char.standing.color_text,
-                ' standing towards you.'
-            ))
+            if self.simulation is not None:
+                self.simulation.sync(char)
+            self._say(result, catalog['world.info.standing'], char, char.standing)
             if (i := char.info):
-                self._prefix()
-                console.print(Text.assemble(char.display_name, '-', i))
+                self._say(result, catalog['world.info.character'], char, i)
         else:
-            self._prefix()
-            console.print('I don\'t know what do you mean.')
+            self._say(result, catalog['world.info.unknown'])
+            self._did_you_mean(result, [
+                *self._location_names.suggest(name),
+                *self._character_names.suggest(name)
+            ][:3])
 
     def assistant(self, text: str | Text) -> None:
         """Displays additional help if the player requested it during the first :meth:`FTE.world.World.interaction`.
@@ -447,9 +656,140 @@ class World:
         :type text: :obj:`str` or :class:`rich.text.Text`
         """
         if self._assistant:
-            console.print(text)
+            self._console.print(text)
+
+    def _resolve_argument(self, command: Command | None, argument: str) -> str:
+        """Expands an abbreviated argument, e.g. ``eng`` to ``Engine Deck`` for the ``go`` command.
 
-    def interaction(self) -> Character | Location | None:
+        :param command: The command.
+        :type command: :class:`FTE.world.Command` or `None`
+        :param argument: The argument or its' unambiguous prefix.
+        :type argument: :obj:`str`
+        :return: Full argument, or the same argument if it can't be expanded.
+        :rtype: :obj:`str`
+        """
+        if not command or not argument:
+            return argument
+        match command.name:
+            case 'go':
+                entity = self._location_names.resolve(argument)
+            case 'talk':
+                entity = self._character_names.resolve(argument)
+            case 'help':
+                return HELP_MENUS.resolve(argument) or argument
+            case 'info':
+                if argument in self._location_names or argument in self._character_names:
+                    return argument
+                entity = self._location_names.resolve(argument) or self._character_names.resolve(argument)
+            case _:
+                return argument
+        return entity.name if entity else argument
+
+    def complete(self, line: str, limit: int = 50) -> list[str]:
+        """Completes a partially typed command.
+
+        :param line: What the player has typed so far.
+        :type line: :obj:`str`
+        :param limit: Maximum number of completions.
+        :type limit: :obj:`int`
+        :return: Possible full commands.
+        :rtype: :obj:`list` of :obj:`str`
+        """
+        command, space, argument = line.partition(' ')
+        if not space:
+            return [c.name for c in _commands().complete(command, limit)]
+        if not (command := _command(command)):
+            return []
+        match command.name:
+            case 'go':
+                names = [l.name for l in self._location_names.complete(argument, limit)]
+            case 'talk':
+                names = [c.name for c in self._character_names.complete(argument, limit)]
+            case 'help':
+                names = HELP_MENUS.complete(argument, limit)
+            case 'info':
+                names = [l.name for l in self._location_names.complete(argument, limit)]
+                names += [c.name for c in self._character_names.complete(argument, limit - len(names))]
+            case _:
+                names = []
+        return [f'{command.name} {name}' for name in names]
+
+    def _readline_complete(self, text: str, state: int) -> str | None:
+        """Completer for :mod:`readline`, see :meth:`FTE.world.World.complete`."""
+        if state == 0:
+            self._completions = self.complete(text)
+        return self._completions[state] if state < len(self._completions) else None
+
+    def _enable_completion(self) -> None:
+        """Completes commands with tab key, when the player types in a terminal. Installed once per world."""
+        if self._completion_enabled:
+            return
+        self._completion_enabled = True
+        if self._console.input_stream is not None or not self._console.is_terminal:
+            return
+        try:
+            import readline
+        except ImportError:  # Not available on Windows
+            return
+        readline.set_completer_delims('')
+        readline.set_completer(self._readline_complete)
+        readline.parse_and_bind('tab: complete')
+
+    def execute(self, query: str) -> Result:
+        """Executes a player's command without displaying anything, then dispatches its' events to triggers
+        (which mustn't be coroutine functions, those are awaited by :meth:`interaction`).
+        Commands and their arguments can be abbreviated to unambiguous prefixes.
+
+        :param query: The command with an optional argument, e.g. ``"go Engine Deck"``.
+        :type query: :obj:`str`
+        :return: What happened, to be displayed with :meth:`FTE.results.Result.render`.
+        :rtype: :class:`FTE.results.Result`
+        """
+        result = self._execute(query)
+        self.events.dispatch()
+        return result
+
+    def _execute(self, query: str) -> Result:
+        """Executes a player's command, its' events are posted but not dispatched, see :meth:`execute`."""
+        if self.simulation is not None:
+            self.simulation.observe()
+        result = Result(query)
+        command, _, argument = query.partition(' ')
+        result.command = command = _command(command)
+        result.argument = argument = self._resolve_argument(command, argument) if _ else None
+        if not command:
+            self._fails += 1
+            if self._fails >= 3:
+                self._say(result, catalog['world.unknown.hint'])
+            else:
+                self._say(result, catalog['world.unknown'])
+            self._did_you_mean(result, [f'"{c.name}"' for c in _commands().suggest(query.partition(' ')[0])])
+            return result
+        self._fails = 0
+        match command.name:
+            case 'exit':
+                self._command_exit(result)
+            case 'help':
+                self._command_help(result, argument)
+            case 'talk':
+                self._command_talk(result, argument)
+            case 'go':
+                self._command_go(result, argument)
+            case 'info':
+                self._command_info(result, argument)
+        return result
+
+    def execute_many(self, queries: list[str]) -> list[Result]:
+        """Executes many player's commands without displaying anything, see :meth:`FTE.world.World.execute`.
+
+        :param queries: The commands.
+        :type queries: :obj:`list` of :obj:`str`
+        :return: Results of all commands.
+        :rtype: :obj:`list` of :class:`FTE.results.Result`
+        """
+        return [self.execute(query) for query in queries]
+
+    async def interaction(self) -> Character | Location | None:
         """
         The main game logic. Controls interactions between the player and world.
         For example talking to characters and going to locations.
@@ -458,48 +798,27 @@ class World:
         :return: The object with wich player got with interaction. `None` if doesn't apply.
         :rtype: :class:`FTE.characters.Character`, :class:`FTE.locations.Location`, or `None`
         """
+        result = await self._interact()
+        await self.events.dispatch_async()
+        get_session().interacted(result)
+        return result
+
+    async def _interact(self) -> Character | Location | None:
+        """Reads, executes and displays a single player's command, see :meth:`FTE.world.World.interaction`."""
         if self._first_interaction:
-            self._do_first_interaction()
+            await self._do_first_interaction()
             return None
+        self._enable_completion()
         query = ''
         while not query:
             try:
                 self._prefix()
-                query = console.input('')
+                query = await get_session().input('')
             except KeyboardInterrupt:
-                console.print(Text.assemble(
-                    ' Retry...',
-                    style=Style(
-                        color='yellow',
-                        italic=True
-                )))
+                Retry().render(self._console)
                 continue
-        try:
-            query.index(' ')
-        except ValueError:
-            command, argument = query, None
-        else:
-            [command, argument] = query.split(' ', 1)
-        command = COMMANDS.get(command)
-        if not command:
-            self._fails += 1
-            self._prefix()
-            if self._fails >= 3:
-                console.print('Psst, you can use `help`.')
-            else:
-                console.print('I\'m not sure what do you mean.')
-            return None
-        self._fails = 0
-        match command.name:
-            case 'exit':
-                self._command_exit()
-            case 'help':
-                self._command_help(argument)
-                return None
-            case 'talk':
-                return self._command_talk(argument)
-            case 'go':
-                return self._command_go(argument)
-            case 'info':
-                self._command_info(argument)
-                return None
+        result = self._execute(query)
+        await result.render(self._console)
+        if result.exit:
+            exit()
+        return result.target
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the game's hot paths. Run them with::
+
+    python -m benchmarks
+
+Every benchmark is a function registered with :func:`benchmark`, which prepares
+its data and returns a callable doing a single operation. The operation is
+timed many times and the best time per operation is reported.
+
+Memory benchmarks are registered with :func:`memory_benchmark`, their operation
+creates objects and returns them with their count. Memory allocated by the
+operation per object is reported, and it fails if it's over the benchmark's budget.
+"""
+from gc import collect
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Callable
+
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+MEMORY_BENCHMARKS: dict[str, Callable[[], Callable[[], tuple[object, int]]]] = {}
+MEMORY_BUDGETS: dict[str, float] = {}  # Maximum bytes per object of memory benchmarks
+
+
+def benchmark(name: str) -> Callable:
+    """Registers a benchmark.
+
+    :param name: Unique name of the benchmark, used in results and baselines.
+    :type name: :obj:`str`
+    :return: Decorator of a function preparing the benchmark.
+    :rtype: :obj:`typing.Callable`
+    """
+    def decorator(setup: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def memory_benchmark(name: str, budget: float = None) -> Callable:
+    """Registers a memory benchmark.
+
+    :param name: Unique name of the benchmark, used in results and baselines.
+    :type name: :obj:`str`
+    :param budget: Maximum bytes per object, defaults to no limit.
+    :type budget: :obj:`float`
+    :return: Decorator of a function preparing the benchmark.
+    :rtype: :obj:`typing.Callable`
+    """
+    def decorator(setup: Callable[[], Callable[[], tuple[object, int]]]) -> Callable[[], Callable[[], tuple[object, int]]]:
+        MEMORY_BENCHMARKS[name] = setup
+        if budget is not None:
+            MEMORY_BUDGETS[name] = budget
+        return setup
+    return decorator
+
+
+def measure_memory(operation: Callable[[], tuple[object, int]]) -> float:
+    """Measures how much memory objects created by an operation take.
+
+    :param operation: The operation, returns created objects and their count.
+    :type operation: :obj:`typing.Callable`
+    :return: Bytes per object.
+    :rtype: :obj:`float`
+    """
+    collect()
+    start()
+    try:
+        before = get_traced_memory()[0]
+        objects, count = operation()
+        allocated = get_traced_memory()[0] - before
+    finally:
+        stop()
+    del objects
+    return allocated / count
+
+
+def measure(operation: Callable[[], object], *, budget: float = 0.2, rounds: int = 5) -> float:
+    """Measures how long an operation takes.
+
+    :param operation: The operation.
+    :type operation: :obj:`typing.Callable`
+    :param budget: Approximate time of a single round in seconds.
+    :type budget: :obj:`float`
+    :param rounds: How many rounds, the best one is used.
+    :type rounds: :obj:`int`
+    :return: Best time of a single operation in seconds.
+    :rtype: :obj:`float`
+    """
+    start = perf_counter()
+    operation()
+    first = perf_counter() - start
+    loops = max(1, int(budget / first)) if first > 0 else 1000
+    best = first
+    for _ in range(rounds):
+        start = perf_counter()
+        for _ in range(loops):
+            operation()
+        best = min(best, (perf_counter() - start) / loops)
+    return best
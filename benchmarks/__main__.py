@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Runs benchmarks, saves results as JSON and compares them with a baseline::
+
+    python -m benchmarks --save-baseline
+    python -m benchmarks --output results.json --threshold 0.25 --threshold-for startup.import=0.5
+
+Exits with code ``1`` if any benchmark is slower (or takes more memory) than the baseline by more than its threshold,
+if a memory benchmark is over its budget,
+or if startup imports modules, which should be imported on first use, or the supervisor doesn't import them before
+forking, see :mod:`benchmarks.imports`.
+"""
+from argparse import ArgumentParser
+from fnmatch import fnmatch
+from json import dump, load
+from pathlib import Path
+from platform import python_version
+from sys import exit as sys_exit
+
+import benchmarks.cases  # noqa: F401 -- registers benchmarks
+from benchmarks import BENCHMARKS, MEMORY_BENCHMARKS, MEMORY_BUDGETS, measure, measure_memory
+from benchmarks.imports import STARTUP, SUPERVISOR, check, check_warm, import_times, report as import_report
+
+
+BASELINE: Path = Path(__file__).parent / 'baseline.json'
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], thresholds: dict[str, float], default: float) -> list[str]:
+    """Finds benchmarks slower than the baseline.
+
+    :param results: Seconds per operation (or bytes per object) of each benchmark.
+    :type results: :obj:`dict`
+    :param baseline: Results of each benchmark in the baseline.
+    :type baseline: :obj:`dict`
+    :param thresholds: Allowed slowdown of chosen benchmarks, e.g. ``0.5`` is 50%.
+    :type thresholds: :obj:`dict`
+    :param default: Allowed slowdown of other benchmarks.
+    :type default: :obj:`float`
+    :return: Descriptions of regressions.
+    :rtype: :obj:`list` of :obj:`str`
+    """
+    regressions = []
+    for name, seconds in results.items():
+        if not (before := baseline.get(name)):
+            continue
+        allowed = next((t for pattern, t in thresholds.items() if fnmatch(name, pattern)), default)
+        if (ratio := seconds / before) > 1 + allowed:
+            regressions.append(f'{name}: {ratio:.2f}x worse than baseline (allowed {1 + allowed:.2f}x)')
+    return regressions
+
+
+def main() -> None:
+    parser = ArgumentParser('python -m benchmarks', description='Benchmarks Fix The Engines.')
+    parser.add_argument('patterns', nargs='*', default=['*'], help='run only matching benchmarks, e.g. "world.*"')
+    parser.add_argument('--output', type=Path, help='save results as JSON')
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='save results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown, defaults to 0.2 (20%%)')
+    parser.add_argument(
+        '--threshold-for',
+        action='append',
+        default=[],
+        metavar='PATTERN=THRESHOLD',
+        help='allowed slowdown of matching benchmarks'
+    )
+    parser.add_argument('--imports', action='store_true', help='report the slowest imports at startup')
+    parser.add_argument('--import-budget', type=float, metavar='MS', help='maximum import time at startup')
+    args = parser.parse_args()
+    thresholds = {
+        pattern: float(threshold)
+        for pattern, threshold in (option.split('=', 1) for option in args.threshold_for)
+    }
+
+    results: dict[str, float] = {}
+    violations: list[str] = []
+    for name, setup in BENCHMARKS.items():
+        if not any(fnmatch(name, pattern) for pattern in args.patterns):
+            continue
+        results[name] = measure(setup())
+        print(f'{name:<40} {1e6 * results[name]:>14.3f} µs')
+    for name, setup in MEMORY_BENCHMARKS.items():
+        if not any(fnmatch(name, pattern) for pattern in args.patterns):
+            continue
+        results[name] = measure_memory(setup())
+        print(f'{name:<40} {results[name]:>14.1f} B')
+        if (budget := MEMORY_BUDGETS.get(name)) is not None and results[name] > budget:
+            violations.append(f'{name}: {results[name]:.1f} B per object (budget {budget:.0f} B)')
+    if args.imports or any(fnmatch('startup.import_time', pattern) for pattern in args.patterns):
+        times = import_times()
+        results['startup.import_time'] = times[STARTUP][1]
+        print(f'{"startup.import_time":<40} {1e6 * results["startup.import_time"]:>14.3f} µs')
+        if args.imports:
+            print(*import_report(times), sep='\n')
+        violations.extend(check(times, args.import_budget / 1e3 if args.import_budget else None))
+        violations.extend(check_warm(import_times(SUPERVISOR, runs=1)))
+
+    report = dict(python=python_version(), results=results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            dump(report, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            dump(report, file, indent=2)
+    elif not args.baseline.exists():
+        print(f'No baseline in {args.baseline}, save one with --save-baseline.')
+    else:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = load(file)['results']
+        violations.extend(compare(results, baseline, thresholds, args.threshold))
+        if not violations:
+            print('No regressions.')
+    if violations:
+        print(*violations, sep='\n')
+        sys_exit(1)
+
+
+if __name__ == '__main__':
+    main()
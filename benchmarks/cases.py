@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of lookups, turns, rendering and startup.
+"""
+from os import devnull
+from pathlib import Path
+from subprocess import run
+from sys import executable, intern
+
+from FTE.characters import Character
+from FTE.console import CONSOLES, render_cache
+from FTE.dialogue import Dialogue
+from FTE.events import EventType
+from FTE.locations import Location
+from FTE.menus import _draw_banner
+from FTE.pacing import VirtualClock
+from FTE.session import Session, run_blocking
+from FTE.utils import slow_print
+from FTE.world import World
+
+from benchmarks import benchmark, memory_benchmark
+
+try:
+    from FTE.simulation import Simulation
+except ImportError:  # NumPy is optional
+    Simulation = None
+
+
+SIZES: tuple[int] = (10, 1_000, 100_000)  # Entities in synthetic worlds
+DECKS: tuple[int] = (10, 100)  # Side of square decks of rooms
+CROWDS: tuple[int] = (10_000, 1_000_000)  # Ambient characters in simulations
+ROOT: Path = Path(__file__).parent.parent
+_DEVNULL = open(devnull, 'w')  # Discarded output of all quiet sessions, shared so setups don't leak files
+
+
+class _Repeat:
+    """Input stream, which endlessly repeats the same lines.
+
+    :param lines: Player's lines.
+    :type lines: :obj:`list` of :obj:`str`
+    """
+    def __init__(self, lines: list[str]) -> None:
+        self._lines: list[str] = [f'{line}\n' for line in lines]
+        self._next: int = 0
+
+    def readline(self) -> str:
+        line = self._lines[self._next]
+        self._next = (self._next + 1) % len(self._lines)
+        return line
+
+
+def synthetic_world(entities: int) -> World:
+    """Creates a world, where every tenth entity is a location and others are characters.
+
+    :param entities: How many locations and characters together.
+    :type entities: :obj:`int`
+    :return: The world, player starts in the first location.
+    :rtype: :class:`FTE.world.World`
+    """
+    locations = [Location(f'Location {i}', f'Location number {i}.') for i in range(max(1, entities // 10))]
+    characters = [
+        Character(f'Character {i}', locations[i % len(locations)], poke='Hi.')
+        for i in range(entities - len(locations))
+    ]
+    return World(locations, characters, locations[0])
+
+
+def synthetic_deck(side: int) -> World:
+    """Creates a world, where locations are a square grid of rooms with doors to their neighbours.
+
+    :param side: How many rooms on each side of the deck.
+    :type side: :obj:`int`
+    :return: The world, player starts in a corner.
+    :rtype: :class:`FTE.world.World`
+    """
+    rooms = [[Location(f'Room {x}-{y}') for y in range(side)] for x in range(side)]
+    doors = [(rooms[x][y], rooms[x + 1][y]) for x in range(side - 1) for y in range(side)]
+    doors += [(rooms[x][y], rooms[x][y + 1]) for x in range(side) for y in range(side - 1)]
+    return World([room for row in rooms for room in row], [], rooms[0][0], doors=doors)
+
+
+def quiet_session(lines: list[str] = None, console: str = 'rich') -> Session:
+    """Session without pacing, which discards output.
+
+    :param lines: Player's lines, repeated endlessly.
+    :type lines: :obj:`list` of :obj:`str`
+    :param console: ``"rich"`` or ``"ansi"``, see :mod:`FTE.console`.
+    :type console: :obj:`str`
+    :return: The session.
+    :rtype: :class:`FTE.session.Session`
+    """
+    return Session(
+        CONSOLES[console](
+            file=_DEVNULL,
+            input_stream=_Repeat(lines or ['']),
+            width=80,
+            color_system='standard',
+            force_terminal=True,
+            highlight=False
+        ),
+        VirtualClock()
+    )
+
+
+def _sized(name: str, setup) -> None:
+    """Registers a benchmark for every size of synthetic world.
+
+    :param name: Name of the benchmark, the size is appended.
+    :type name: :obj:`str`
+    :param setup: Function preparing the benchmark for a world.
+    :type setup: :obj:`typing.Callable`
+    """
+    for size in SIZES:
+        benchmark(f'{name}[{size}]')(lambda size=size: setup(synthetic_world(size)))
+
+
+def _find_location(world: World):
+    name = f'location {len(world._all_locations) - 1}'
+    return lambda: world.find_location(name)
+
+
+def _find_character(world: World):
+    name = f'character {len(world._all_characters) - 1}'
+    return lambda: world.find_character(name)
+
+
+def _characters(world: World):
+    return lambda: world.characters
+
+
+def _interaction(world: World, console: str = 'rich'):
+    session = quiet_session(['go Location 0', 'info Character 0', 'talk Character 0', 'help commands'], console)
+    world._location = world._all_locations[-1]
+
+    def interaction() -> None:
+        with session:
+            run_blocking(world.interaction())
+    return interaction
+
+
+def _interaction_ansi(world: World):
+    return _interaction(world, 'ansi')
+
+
+def _complete(world: World):
+    return lambda: world.complete('go location 9', 10)
+
+
+def _suggest(world: World):
+    return lambda: world._location_names.suggest('Locatoin 7')
+
+
+def _room_listing(world: World):
+    session = quiet_session()
+
+    def room_listing() -> None:
+        with session:
+            run_blocking(world.execute('info').render(session.console))
+    return room_listing
+
+
+def _shift_group(world: World):
+    standings = world.standings
+    for character in world._all_characters[::2]:
+        standings.join(character, 'crew')
+
+    def shift_group() -> None:
+        standings.shift_group('crew', 15)
+        standings.shift_group('crew', -15)
+    return shift_group
+
+
+def _group_standing(world: World):
+    return lambda: world.standings.standing(world._all_locations[0])
+
+
+def _triggers(world: World):
+    fired = []
+    for location in world._all_locations:
+        world.events.on(EventType.GO, location, fired.append)
+    for character in world._all_characters:
+        world.events.on(EventType.TALK, character, fired.append)
+        world.events.on(EventType.STANDING_CHANGED, character, fired.append)
+    queries = ['go Location 0', 'talk Character 0', 'go Location 1']
+
+    def triggers() -> None:
+        world.execute_many(queries)
+        assert fired, 'Triggers must fire through World.execute'
+        fired.clear()
+    return triggers
+
+
+def _execute(world: World):
+    queries = ['go Location 0', 'info Character 0', 'talk Character 0', 'go Location 1']
+    return lambda: world.execute_many(queries)
+
+
+_sized('world.find_location', _find_location)
+_sized('world.find_character', _find_character)
+_sized('world.characters', _characters)
+_sized('world.interaction', _interaction)
+_sized('world.interaction.ansi', _interaction_ansi)
+_sized('world.execute_many', _execute)
+_sized('world.complete', _complete)
+_sized('world.suggest', _suggest)
+_sized('world.room_listing', _room_listing)
+_sized('events.triggers', _triggers)
+_sized('standings.shift_group', _shift_group)
+_sized('standings.group_standing', _group_standing)
+
+
+@memory_benchmark('memory.location', budget=128)
+def location_memory():
+    names = [intern(f'Location {i}') for i in range(10_000)]  # Unique texts aren't counted
+
+    def location_memory():
+        locations = [Location(name, 'A room.') for name in names]
+        return locations, len(locations)
+    return location_memory
+
+
+@memory_benchmark('memory.character', budget=160)
+def character_memory():
+    location = Location('Somewhere')
+    names = [intern(f'Character {i}') for i in range(10_000)]
+
+    def character_memory():
+        characters = [Character(name, location, info='Crew.', poke='Hi.') for name in names]
+        return characters, len(characters)
+    return character_memory
+
+
+for _size in SIZES[1:]:
+    memory_benchmark(f'memory.world[{_size}]')(lambda size=_size: lambda: (synthetic_world(size), size))
+
+
+def _route(world: World):
+    graph, start, goal = world.graph, world._all_locations[0], world._all_locations[-1]
+    return lambda: graph.route(start, goal)
+
+
+def _uncached_route(world: World):
+    graph, start, goal = world.graph, world._all_locations[0], world._all_locations[-1]
+
+    def uncached_route() -> None:
+        graph._trees.clear()
+        graph.route(start, goal)
+    return uncached_route
+
+
+def _info(world: World):
+    return lambda: world.execute('info')
+
+
+def _door(world: World):
+    graph, start, goal = world.graph, world._all_locations[0], world._all_locations[-1]
+    a, b = world._all_locations[-2], goal
+    graph.route(start, goal)
+
+    def door() -> None:
+        graph.close_door(a, b)
+        graph.open_door(a, b)
+        graph.route(start, goal)
+    return door
+
+
+for _side in DECKS:
+    for _name, _setup in (('route', _route), ('route.uncached', _uncached_route), ('door', _door), ('info', _info)):
+        benchmark(f'deck.{_name}[{_side * _side}]')(lambda side=_side, setup=_setup: setup(synthetic_deck(side)))
+
+
+def synthetic_simulation(crowd: int) -> Simulation:
+    """Creates a simulation of a world with 100 locations and ambient characters walking between them.
+
+    :param crowd: How many ambient characters.
+    :type crowd: :obj:`int`
+    :return: The simulation, characters move every 20 to 120 ticks.
+    :rtype: :class:`FTE.simulation.Simulation`
+    """
+    import numpy as np
+
+    generator = np.random.default_rng(0)
+    simulation = Simulation(synthetic_world(1_000))
+    simulation.spawn(
+        'Crewman',
+        generator.integers(0, 100, (crowd, 4)),
+        generator.integers(20, 120, crowd),
+        phases=generator.integers(0, 120, crowd),
+        standings=generator.integers(-10, 11, crowd),
+        targets=generator.integers(-10, 11, crowd)
+    )
+    return simulation
+
+
+def _tick(crowd: int):
+    simulation = Simulation(synthetic_world(10))  # Opposite-sign extremes must converge, not overflow
+    simulation.spawn('Crewman', [[0]] * 3, 1, standings=[-100, -50, 100], targets=[100, 100, -100])
+    for _ in range(3):
+        simulation.tick()
+    assert simulation.standing.tolist() == [-97, -47, 97], 'Standings must shift towards their targets'
+    return synthetic_simulation(crowd).tick
+
+
+def _observe(crowd: int):
+    simulation = synthetic_simulation(crowd)
+    simulation.observe()
+
+    def observe() -> None:
+        simulation.tick()
+        simulation.observe()
+    return observe
+
+
+if Simulation is not None:
+    for _crowd in CROWDS:
+        benchmark(f'simulation.tick[{_crowd}]')(lambda crowd=_crowd: _tick(crowd))
+        benchmark(f'simulation.observe[{_crowd}]')(lambda crowd=_crowd: _observe(crowd))
+
+
+def synthetic_dialogue(nodes: int, replies: int = 100) -> Dialogue:
+    """Creates a conversation, where every node asks a question and the player chooses from many replies.
+
+    :param nodes: How many nodes, the last reply of a node leads to the following node.
+    :type nodes: :obj:`int`
+    :param replies: How many replies every node accepts.
+    :type replies: :obj:`int`
+    :return: The conversation, it ends with a node without question.
+    :rtype: :class:`FTE.dialogue.Dialogue`
+    """
+    data = {f'node {i}': dict(
+        ask='one.hevy.dead',
+        retry='one.hevy.silence',
+        replies={f'Reply {j}': f'node {i if j < replies - 1 else i + 1}' for j in range(replies)}
+    ) for i in range(nodes)}
+    data[f'node {nodes}'] = dict(lines=[['say', 'one.more']])
+    return Dialogue(dict(start='node 0', nodes=data))
+
+
+@benchmark('dialogue.play[1000]')
+def dialogue_play():
+    dialogue, session = synthetic_dialogue(1_000), quiet_session(['reply   99'])
+    character = Character('Hevy', Location('Quarters'))
+
+    def dialogue_play() -> None:
+        with session:
+            run_blocking(dialogue.play(character))
+    return dialogue_play
+
+
+@benchmark('dialogue.compile[1000]')
+def dialogue_compile():
+    return lambda: synthetic_dialogue(1_000)
+
+
+@benchmark('world.command_help')
+def command_help():
+    world, session = synthetic_world(10), quiet_session()
+
+    def command_help() -> None:
+        with session:
+            run_blocking(world.execute('help').render(session.console))
+    return command_help
+
+
+@benchmark('menus.banner')
+def banner():
+    session = quiet_session()
+
+    def banner() -> None:
+        render_cache.draw(session.console, 'main menu', lambda: _draw_banner(session.console))
+    return banner
+
+
+@benchmark('utils.print_with_interval')
+def print_with_interval():
+    session = quiet_session()
+
+    def print_with_interval() -> None:
+        with session:
+            run_blocking(slow_print('Mission:   Who cares?'))
+    return print_with_interval
+
+
+@benchmark('startup.import')
+def startup_import():
+    def startup_import() -> None:
+        run([executable, '-c', 'import FTE.__main__'], cwd=ROOT, check=True)
+    return startup_import
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Import-time report of the game's startup, based on ``python -X importtime``::
+
+    python -m benchmarks startup.* --imports --import-budget 90
+
+Modules in :data:`DEFERRED` must not be imported before the main menu is shown,
+they are imported on first use. The supervisor must import them before forking workers (see :data:`WARM`).
+"""
+from subprocess import run
+from sys import executable
+
+from benchmarks.cases import ROOT
+
+
+STARTUP: str = 'FTE.__main__'  # Imported by ``python -m FTE`` before the main menu
+DEFERRED: tuple[str] = (  # Imported on first use, never at startup
+    'asyncio',  # Only the server runs games in an event loop, see :func:`FTE.session.run_blocking`
+    'rich.table',
+    'readline',
+    'FTE.chapters.one',
+    'FTE.world',
+    'FTE.parser'
+)
+
+SUPERVISOR: str = 'FTE.supervisor'  # Imports the game before forking workers
+WARM: tuple[str] = (  # Imported by the supervisor, so workers don't import them for their first players
+    'rich.table',
+    'FTE.chapters.one',
+    'FTE.world',
+    'FTE.parser'
+)
+
+
+def import_times(module: str = STARTUP, runs: int = 5) -> dict[str, tuple[float, float]]:
+    """Measures how long importing a module and all its' dependencies takes, in a fresh interpreter.
+
+    :param module: The module.
+    :type module: :obj:`str`
+    :param runs: How many times to import, the fastest times are used.
+    :type runs: :obj:`int`
+    :return: Imported modules mapped to their own and cumulative import time in seconds, in import order.
+    :rtype: :obj:`dict`
+    """
+    times: dict[str, tuple[float, float]] = {}
+    for _ in range(runs):
+        stderr = run(
+            [executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stderr
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or line.endswith('imported package'):
+                continue
+            own, cumulative, name = line[len('import time:'):].split('|')
+            own, cumulative, name = int(own) / 1e6, int(cumulative) / 1e6, name.strip()
+            if name in times:
+                own, cumulative = min(own, times[name][0]), min(cumulative, times[name][1])
+            times[name] = own, cumulative
+    return times
+
+
+def report(times: dict[str, tuple[float, float]], limit: int = 15) -> list[str]:
+    """Describes the slowest imports.
+
+    :param times: Result of :func:`import_times`.
+    :type times: :obj:`dict`
+    :param limit: How many modules to describe.
+    :type limit: :obj:`int`
+    :return: Lines of the report, slowest modules (by their own time) first.
+    :rtype: :obj:`list` of :obj:`str`
+    """
+    slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+    return [
+        f'{name:<40} {1e3 * own:>9.1f} ms {1e3 * cumulative:>9.1f} ms cumulative'
+        for name, (own, cumulative) in slowest
+    ]
+
+
+def check(times: dict[str, tuple[float, float]], budget: float = None, module: str = STARTUP) -> list[str]:
+    """Finds modules imported too early and imports over budget.
+
+    :param times: Result of :func:`import_times`.
+    :type times: :obj:`dict`
+    :param budget: Maximum cumulative import time of the module in seconds, defaults to no limit.
+    :type budget: :obj:`float`
+    :param module: The measured module.
+    :type module: :obj:`str`
+    :return: Descriptions of violations.
+    :rtype: :obj:`list` of :obj:`str`
+    """
+    violations = [f'{name}: imported at startup, should be imported on first use' for name in DEFERRED if name in times]
+    if budget is not None and (cumulative := times[module][1]) > budget:
+        violations.append(f'{module}: imported in {1e3 * cumulative:.1f} ms (budget {1e3 * budget:.1f} ms)')
+    return violations
+
+
+def check_warm(times: dict[str, tuple[float, float]]) -> list[str]:
+    """Finds modules, which the supervisor doesn't import before forking workers.
+
+    :param times: Result of :func:`import_times` of :data:`SUPERVISOR`.
+    :type times: :obj:`dict`
+    :return: Descriptions of violations.
+    :rtype: :obj:`list` of :obj:`str`
+    """
+    return [f'{name}: not imported by {SUPERVISOR}, workers would import it on first use' for name in WARM if name not in times]